@@ -8,6 +8,7 @@ import requests
 import logging
 import time
 from typing import List, Dict, Optional
+from .base import make_session
 
 logger = logging.getLogger(__name__)
 
@@ -28,13 +29,16 @@ class ActiveJobsClient:
 
     BASE_URL = "https://active-jobs-db.p.rapidapi.com"
 
-    def __init__(self, api_key: str, key_name: str = "Unknown", all_keys: List[Dict] = None):
+    def __init__(self, api_key: str, key_name: str = "Unknown", all_keys: List[Dict] = None,
+                 session: requests.Session = None):
         """
         Args:
             api_key:   Primary key to use
             key_name:  Label for logging
             all_keys:  Full list of key dicts [{"name":..., "key":...}, ...] for rotation
+            session:   Shared keep-alive session (one is made if omitted)
         """
+        self.session = session or make_session()
         self.current_key = api_key
         self.key_name = key_name
         self.all_keys = all_keys or []
@@ -77,7 +81,7 @@ class ActiveJobsClient:
 
         for attempt in range(max_attempts):
             try:
-                resp = requests.get(
+                resp = self.session.get(
                     f"{self.BASE_URL}/{endpoint}",
                     headers=self._headers(),
                     params=params,
@@ -9,7 +9,7 @@ Endpoint: api.adzuna.com/v1/api/jobs/{country}/search/{page}
 import requests
 import time
 from typing import List, Dict
-from .base import BaseAPIClient
+from .base import BaseAPIClient, make_session
 
 SEARCH_QUERIES = [
     'software engineer new grad',
@@ -25,7 +25,8 @@ SEARCH_QUERIES = [
 class AdzunaClient(BaseAPIClient):
     """Client for Adzuna job search API."""
 
-    def __init__(self, app_id: str, app_key: str):
+    def __init__(self, app_id: str, app_key: str, session: requests.Session = None):
+        self.session = session or make_session()
         self.app_id = app_id
         self.app_key = app_key
         self.base_url = "https://api.adzuna.com/v1/api/jobs"
@@ -71,7 +72,7 @@ class AdzunaClient(BaseAPIClient):
             'max_days_old': 7,
         }
 
-        response = requests.get(url, params=params, timeout=15)
+        response = self.session.get(url, params=params, timeout=15)
         response.raise_for_status()
         data = response.json()
 
@@ -1,7 +1,37 @@
 """Base class for career site API clients"""
 
+import requests
 from typing import List, Dict, Optional
 from abc import ABC, abstractmethod
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def make_session(pool_connections: int = 32, pool_maxsize: int = 128) -> requests.Session:
+    """Keep-alive session shared by the API clients.
+
+    One TLS handshake per host is reused across every request to it. Transient
+    5xx responses are retried with backoff. 429 is deliberately left to the
+    clients, which rotate RapidAPI keys on it instead of waiting. Connect and
+    read errors/timeouts are not retried: a hung host costs one timeout, as
+    before, and can't push a source past its SOURCE_TIMEOUT deadline.
+    """
+    retry = Retry(
+        total=3,
+        connect=0,
+        read=0,
+        backoff_factor=0.5,
+        status_forcelist=(500, 502, 503, 504),
+        raise_on_status=False,  # hand back the last response; callers check it
+    )
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=retry,
+    ))
+    return session
+
 
 class BaseAPIClient(ABC):
     """Base class for all ATS API clients"""
@@ -20,7 +20,7 @@ import time
 from typing import List, Dict
 from datetime import datetime, timedelta
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from .base import BaseAPIClient
+from .base import BaseAPIClient, make_session
 
 
 # ── 1000+ Greenhouse company tokens ──────────────────────────────
@@ -263,7 +263,9 @@ CACHE_TTL_DAYS = 7
 class GreenhouseClient(BaseAPIClient):
     """Client for Greenhouse job boards — 1000+ companies with validation cache."""
 
-    def __init__(self):
+    def __init__(self, session: requests.Session = None):
+        # Every board lives on boards-api.greenhouse.io — one keep-alive pool
+        self.session = session or make_session()
         self.base_url = "https://boards-api.greenhouse.io/v1/boards"
         self._valid_tokens = None
 
@@ -304,7 +306,7 @@ class GreenhouseClient(BaseAPIClient):
     def _check_token(self, token: str) -> bool:
         """Check if a Greenhouse token is valid (returns jobs)."""
         try:
-            r = requests.get(
+            r = self.session.get(
                 f"{self.base_url}/{token}/jobs",
                 timeout=5,
             )
@@ -356,23 +358,29 @@ class GreenhouseClient(BaseAPIClient):
         return valid
 
     # ── Job Fetching ─────────────────────────────────────────────
-    def get_all_jobs(self) -> List[Dict]:
-        """Fetch jobs from all valid Greenhouse boards."""
+    def get_all_jobs(self, max_workers: int = 20) -> List[Dict]:
+        """Fetch jobs from all valid Greenhouse boards (in parallel)."""
         valid_tokens = self.get_valid_tokens()
         all_jobs = []
         errors = 0
 
         print(f"\n  Scraping {len(valid_tokens)} Greenhouse boards...")
 
-        for token, name in valid_tokens.items():
-            try:
-                jobs = self.get_jobs_for_token(token, name)
-                if jobs:
-                    all_jobs.extend(jobs)
-            except Exception as e:
-                errors += 1
-                if errors <= 3:
-                    print(f"    ⚠ {name}: {e}")
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                (name, executor.submit(self.get_jobs_for_token, token, name))
+                for token, name in valid_tokens.items()
+            ]
+            # Collect in board order so results stay deterministic
+            for name, future in futures:
+                try:
+                    jobs = future.result()
+                    if jobs:
+                        all_jobs.extend(jobs)
+                except Exception as e:
+                    errors += 1
+                    if errors <= 3:
+                        print(f"    ⚠ {name}: {e}")
 
         print(f"  → Greenhouse total: {len(all_jobs)} jobs from {len(valid_tokens)} companies")
         return all_jobs
@@ -382,7 +390,7 @@ class GreenhouseClient(BaseAPIClient):
         url = f"{self.base_url}/{token}/jobs"
 
         try:
-            response = requests.get(url, timeout=10)
+            response = self.session.get(url, timeout=10)
             if response.status_code == 404:
                 return []
             response.raise_for_status()
@@ -10,16 +10,17 @@ Endpoints:
 import requests
 import time
 from typing import List, Dict
-from .base import BaseAPIClient
+from .base import BaseAPIClient, make_session
 
 
 class InternshipsAPIClient(BaseAPIClient):
     """Client for Internships API on RapidAPI."""
 
-    def __init__(self, api_keys: Dict[str, str]):
+    def __init__(self, api_keys: Dict[str, str], session: requests.Session = None):
         """
         api_keys: dict of {name: key} — same keys as Active Jobs DB
         """
+        self.session = session or make_session()
         self.api_keys = api_keys
         self.key_names = list(api_keys.keys())
         self.current_key_idx = 0
@@ -85,7 +86,7 @@ class InternshipsAPIClient(BaseAPIClient):
             }
 
             try:
-                response = requests.get(
+                response = self.session.get(
                     f"{self.base_url}/active-ats-7d",
                     headers=headers,
                     params=params,
@@ -3,7 +3,7 @@
 import requests
 import re
 from typing import List, Dict
-from .base import BaseAPIClient
+from .base import BaseAPIClient, make_session
 
 # Known Lever slugs for common companies (saves 404 round-trips)
 KNOWN_SLUGS = {
@@ -51,10 +51,15 @@ KNOWN_SLUGS = {
 class LeverClient(BaseAPIClient):
     """Client for Lever job board API"""
 
-    def __init__(self):
+    def __init__(self, max_workers: int = 32, session: requests.Session = None):
         self.base_url = "https://api.lever.co/v0/postings"
         self._bad_slugs = set()  # Cache 404s to avoid repeats
 
+        # Every company hits api.lever.co, so one keep-alive pool at least as
+        # big as the caller's fan-out reuses TCP/TLS connections
+        self.max_workers = max_workers
+        self.session = session or make_session(pool_connections=1, pool_maxsize=max_workers)
+
     def get_jobs(self, company_info: Dict) -> List[Dict]:
         """Fetch jobs from Lever for a given company."""
         slugs = self._generate_slugs(company_info)
@@ -66,7 +71,7 @@ class LeverClient(BaseAPIClient):
             url = f"{self.base_url}/{slug}?mode=json"
 
             try:
-                response = requests.get(url, timeout=6)
+                response = self.session.get(url, timeout=6)
 
                 if response.status_code == 404:
                     self._bad_slugs.add(slug)
@@ -8,13 +8,14 @@ Rate limit: max 2 requests/minute, ~4 calls/day recommended
 
 import requests
 from typing import List, Dict
-from .base import BaseAPIClient
+from .base import BaseAPIClient, make_session
 
 
 class RemotiveClient(BaseAPIClient):
     """Client for Remotive remote jobs API."""
 
-    def __init__(self):
+    def __init__(self, session: requests.Session = None):
+        self.session = session or make_session()
         self.base_url = "https://remotive.com/api/remote-jobs"
 
     def get_jobs(self, company_info: Dict) -> List[Dict]:
@@ -53,7 +54,7 @@ class RemotiveClient(BaseAPIClient):
             'limit': limit,
         }
 
-        response = requests.get(self.base_url, params=params, timeout=15)
+        response = self.session.get(self.base_url, params=params, timeout=15)
         response.raise_for_status()
         data = response.json()
 
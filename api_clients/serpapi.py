@@ -9,7 +9,7 @@ Requires: SERPAPI_KEY in config.yaml
 import requests
 import time
 from typing import List, Dict
-from .base import BaseAPIClient
+from .base import BaseAPIClient, make_session
 
 SEARCH_QUERIES = [
     '"Software Engineer" new grad',
@@ -26,7 +26,8 @@ SEARCH_QUERIES = [
 class SerpAPIClient(BaseAPIClient):
     """Client for SerpAPI Google Jobs — aggregates LinkedIn, Indeed, Glassdoor, etc."""
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, session: requests.Session = None):
+        self.session = session or make_session()
         self.api_key = api_key
         self.base_url = "https://serpapi.com/search.json"
 
@@ -70,7 +71,7 @@ class SerpAPIClient(BaseAPIClient):
             'api_key': self.api_key,
         }
 
-        response = requests.get(self.base_url, params=params, timeout=15)
+        response = self.session.get(self.base_url, params=params, timeout=15)
         response.raise_for_status()
         data = response.json()
 
@@ -17,7 +17,7 @@ import requests
 import time as _time
 from datetime import datetime, timedelta
 from typing import List, Dict
-from .base import BaseAPIClient
+from .base import BaseAPIClient, make_session
 
 REPOS = [
     {
@@ -61,7 +61,8 @@ SKIP_CATEGORIES = {
 class SimplifyJobsClient(BaseAPIClient):
     """Client for SimplifyJobs GitHub new grad/intern lists."""
 
-    def __init__(self):
+    def __init__(self, session: requests.Session = None):
+        self.session = session or make_session()
         self.max_age_days = 7
 
     def get_jobs(self, company_info: Dict) -> List[Dict]:
@@ -91,7 +92,7 @@ class SimplifyJobsClient(BaseAPIClient):
 
     def _fetch_and_filter(self, repo: Dict) -> List[Dict]:
         """Fetch listings.json and filter to recent + SWE/AI only."""
-        response = requests.get(repo['json_url'], timeout=30)
+        response = self.session.get(repo['json_url'], timeout=30)
 
         if response.status_code == 404:
             print(f"    ⚠ listings.json not found for {repo['name']}")
@@ -6,8 +6,9 @@ Docs: https://www.themuse.com/developers/api/v2
 
 import requests
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional
-from .base import BaseAPIClient
+from .base import BaseAPIClient, make_session
 
 logger = logging.getLogger(__name__)
 
@@ -29,19 +30,29 @@ class TheMuseClient(BaseAPIClient):
 
     BASE_URL = "https://www.themuse.com/api/public/jobs"
 
-    def search_new_grad_software_jobs(self) -> List[Dict]:
+    def __init__(self, session: requests.Session = None):
+        self.session = session or make_session()
+
+    def _fetch_page(self, cfg: Dict):
+        params = {
+            "category": cfg["category"],
+            "page": cfg["page"],
+        }
+        return self.session.get(self.BASE_URL, params=params, timeout=20)
+
+    def search_new_grad_software_jobs(self, max_workers: int = 4) -> List[Dict]:
         """Search for new grad software engineering jobs across categories."""
         all_jobs = []
         seen_ids = set()
 
-        for cfg in SEARCH_CONFIGS:
-            params = {
-                "category": cfg["category"],
-                "page": cfg["page"],
-            }
+        # Fetch all pages concurrently (8 requests, well under 500/hour),
+        # then parse in SEARCH_CONFIGS order
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pages = [executor.submit(self._fetch_page, cfg) for cfg in SEARCH_CONFIGS]
 
+        for cfg, page in zip(SEARCH_CONFIGS, pages):
             try:
-                resp = requests.get(self.BASE_URL, params=params, timeout=20)
+                resp = page.result()
 
                 if resp.status_code != 200:
                     logger.warning(f"[The Muse] HTTP {resp.status_code} for category={cfg['category']} page={cfg['page']}")
@@ -8,10 +8,19 @@ Usage: python cleanup.py
 import sqlite3
 import sys
 
+# Rows archived per transaction — keeps the WAL / rollback journal small
+BATCH_SIZE = 5000
+
+# Truncate the WAL afterwards if at least this many rows were touched
+CHECKPOINT_THRESHOLD = 1000
+
 
 def cleanup_simplifyjobs(db_path: str = "./database/jobs.db"):
     """Remove all SimplifyJobs entries from the database."""
     conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_source ON jobs(source)")
 
     total_before = conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
     simplify_count = conn.execute(
@@ -28,13 +37,27 @@ def cleanup_simplifyjobs(db_path: str = "./database/jobs.db"):
         conn.close()
         return
 
-    # Soft-delete (archive) — consistent with the rest of the app
-    conn.execute("UPDATE jobs SET archived = 1 WHERE source = 'SimplifyJobs'")
-    conn.commit()
+    # Soft-delete (archive) — consistent with the rest of the app.
+    # Done in bounded batches so each transaction stays small.
+    archived_total = 0
+    while True:
+        archived = conn.execute(
+            "UPDATE jobs SET archived = 1 WHERE rowid IN ("
+            "SELECT rowid FROM jobs WHERE source = 'SimplifyJobs' "
+            "AND (archived = 0 OR archived IS NULL) LIMIT ?)",
+            (BATCH_SIZE,),
+        ).rowcount
+        conn.commit()
+        if archived == 0:
+            break
+        archived_total += archived
+
+    if archived_total > CHECKPOINT_THRESHOLD:
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
 
     total_after = conn.execute("SELECT COUNT(*) FROM jobs WHERE archived = 0 OR archived IS NULL").fetchone()[0]
 
-    print(f"\n✅ Archived {simplify_count} SimplifyJobs entries")
+    print(f"\n✅ Archived {archived_total} SimplifyJobs entries")
     print(f"\nAFTER cleanup:")
     print(f"  Total jobs: {total_after}")
 
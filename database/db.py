@@ -1,8 +1,117 @@
 """SQLite database for tracking jobs — with auto-migration for tracker columns."""
 
+import ast
 import sqlite3
-from datetime import datetime
-from typing import List, Dict, Optional, Set
+from collections import namedtuple
+from datetime import datetime, timedelta
+from typing import Iterable, List, Dict, Optional, Set, Tuple
+
+
+# Store timestamps as 'YYYY-MM-DD HH:MM:SS' instead of going through the
+# default (deprecated) datetime adapter on every bind
+sqlite3.register_adapter(datetime, lambda d: d.isoformat(sep=' ', timespec='seconds'))
+
+
+def _now() -> str:
+    return datetime.now().isoformat(sep=' ', timespec='seconds')
+
+
+# Bump when _migrate gains a new one-shot step (stored in PRAGMA user_version)
+SCHEMA_VERSION = 4
+
+
+def _clean_location(raw: str) -> str:
+    """Turn a stored schema.org Place repr (old ActiveJobs rows) into
+    'City, Region, Country'; multiple places are joined with '; '."""
+    try:
+        places = ast.literal_eval(raw)
+    except (ValueError, SyntaxError):
+        return raw
+    if isinstance(places, dict):
+        places = (places,)
+    parts = []
+    for place in places:
+        addr = place.get("address", place) if isinstance(place, dict) else None
+        if isinstance(addr, dict):
+            pieces = [addr.get(k) for k in ("addressLocality", "addressRegion", "addressCountry")]
+            pieces = [p.strip() for p in pieces if p and isinstance(p, str) and p.strip()]
+            if pieces:
+                parts.append(", ".join(pieces))
+    return "; ".join(parts)
+
+
+def norm_field(value: Optional[str]) -> str:
+    """Title/company as dedup compares them: lowercased and stripped.
+    Missing (None) fields count as ''."""
+    return (value or '').lower().strip()
+
+
+def _archived_key(title: Optional[str], company: Optional[str]) -> str:
+    """archived_keys.norm_key for a row — the scraper's dedup key
+    (title, company minus a leading 'the ') joined as 'title|||company'."""
+    return norm_field(title) + '|||' + norm_field(company).removeprefix('the ')
+
+
+def _create_archived_keys(c: sqlite3.Cursor):
+    """archived_keys: one row per archived job with its dedup key. Rows are
+    added from Python (JobDatabase.sync_archived_keys) so the key uses the
+    scraper's normalization — SQLite's LOWER()/TRIM() only fold ASCII.
+    Removal is plain SQL, so unarchiving or deleting a job from any
+    connection (app.py, cleanup.py, the sqlite3 CLI) drops its key."""
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS archived_keys (
+            norm_key TEXT NOT NULL,
+            job_id TEXT NOT NULL,
+            PRIMARY KEY (norm_key, job_id)
+        ) WITHOUT ROWID
+    ''')
+    c.execute("CREATE INDEX IF NOT EXISTS idx_archived_keys_job ON archived_keys(job_id)")
+    c.execute('''
+        CREATE TRIGGER IF NOT EXISTS archive_key_unarchive
+        AFTER UPDATE OF archived ON jobs WHEN NEW.archived IS NOT 1
+        BEGIN
+            DELETE FROM archived_keys WHERE job_id = OLD.job_id;
+        END
+    ''')
+    c.execute('''
+        CREATE TRIGGER IF NOT EXISTS archive_key_delete
+        AFTER DELETE ON jobs
+        BEGIN
+            DELETE FROM archived_keys WHERE job_id = OLD.job_id;
+        END
+    ''')
+
+
+# Hot statements kept as constants so sqlite3's statement cache always hits
+# One statement per job: insert, or bump last_seen/times_seen on a live
+# duplicate. The DO UPDATE's WHERE skips archived rows, which then return
+# nothing; times_seen is 1 only on the row this statement inserted.
+SQL_UPSERT_JOB = """INSERT INTO jobs (
+    job_id, company, title, location, url, description,
+    posted_date, source, score, score_explanation,
+    first_seen, last_seen, notified, status, archived
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(job_id) DO UPDATE SET
+    last_seen = excluded.last_seen,
+    times_seen = COALESCE(jobs.times_seen, 1) + 1
+WHERE jobs.archived = 0 OR jobs.archived IS NULL
+RETURNING times_seen = 1"""
+
+SQL_MARK_NOTIFIED = "UPDATE jobs SET notified = 1 WHERE job_id = ?"
+
+SQL_SAVE_SCORE = """INSERT INTO score_cache (cache_key, score, score_explanation, last_used)
+VALUES (?, ?, ?, ?)
+ON CONFLICT(cache_key) DO UPDATE SET last_used = excluded.last_used"""
+
+# Score-cache entries not seen by a scrape for this long are dropped
+SCORE_CACHE_DAYS = 30
+
+
+# Only the columns the notifier reads — use ._asdict() where a dict is needed
+UnnotifiedJob = namedtuple("UnnotifiedJob", [
+    "job_id", "company", "title", "location", "url",
+    "source", "score", "score_explanation", "first_seen",
+])
 
 
 class JobDatabase:
@@ -10,15 +119,29 @@ class JobDatabase:
 
     def __init__(self, db_path: str = "./database/jobs.db"):
         self.db_path = db_path
+        # One connection for the lifetime of the object, so the statement
+        # cache and page cache survive between calls
+        self._conn = sqlite3.connect(db_path, cached_statements=256)
+        self._conn.execute("PRAGMA cache_spill=0")
+        # WAL + NORMAL: one fsync per checkpoint instead of per commit
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
         self.init_database()
         self._migrate()
 
+    def close(self):
+        self._conn.close()
+
+    def optimize(self):
+        """Cheap planner-stats refresh; call between scrape runs."""
+        self._conn.execute("PRAGMA optimize")
+
     # ------------------------------------------------------------------
     # Schema
     # ------------------------------------------------------------------
     def init_database(self):
         """Create tables if they don't exist."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn
         c = conn.cursor()
 
         c.execute('''
@@ -39,7 +162,8 @@ class JobDatabase:
                 status TEXT DEFAULT 'new',
                 applied_date TIMESTAMP,
                 notes TEXT,
-                archived BOOLEAN DEFAULT 0
+                archived BOOLEAN DEFAULT 0,
+                times_seen INTEGER DEFAULT 1
             )
         ''')
 
@@ -54,12 +178,24 @@ class JobDatabase:
             )
         ''')
 
+        # (resume, job content) hash → score, so jobs that repeat across
+        # runs aren't rescored — see JobScorer.cache_key
+        c.execute('''
+            CREATE TABLE IF NOT EXISTS score_cache (
+                cache_key TEXT PRIMARY KEY,
+                score NUMERIC,
+                score_explanation TEXT,
+                last_used TIMESTAMP
+            ) WITHOUT ROWID
+        ''')
+        # archived_keys is created by _migrate (step 4) — older databases
+        # have a different shape that has to be dropped first
+
         conn.commit()
-        conn.close()
 
     def _migrate(self):
         """Add columns that might be missing in older databases."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn
         c = conn.cursor()
 
         c.execute("PRAGMA table_info(jobs)")
@@ -70,6 +206,7 @@ class JobDatabase:
             ("applied_date", "TIMESTAMP"),
             ("notes", "TEXT"),
             ("archived", "BOOLEAN DEFAULT 0"),
+            ("times_seen", "INTEGER DEFAULT 1"),
         ]
 
         for col_name, col_type in new_columns:
@@ -80,126 +217,204 @@ class JobDatabase:
                 except Exception:
                     pass
 
+        # One-shot steps, skipped entirely on already-migrated databases
+        version = c.execute("PRAGMA user_version").fetchone()[0]
+
+        if version < 2:
+            # Old ActiveJobs rows stored the raw Place dict as the location
+            rows = c.execute(
+                "SELECT job_id, location FROM jobs WHERE location LIKE '%addressLocality%'"
+            ).fetchall()
+            c.executemany(
+                "UPDATE jobs SET location = ? WHERE job_id = ?",
+                [(_clean_location(loc), job_id) for job_id, loc in rows],
+            )
+            if rows:
+                print(f"  ✓ Cleaned {len(rows)} raw location values")
+
+        if version < 4:
+            # archived_keys used to be one key per row, filled by a trigger
+            # (first with SQLite's ASCII-only LOWER(), then with a Python SQL
+            # function every connection had to register). Rebuild it keyed
+            # by job so keys can be removed again; sync_archived_keys fills it.
+            c.execute("DROP TRIGGER IF EXISTS archive_key_ins")
+            c.execute("DROP TABLE IF EXISTS archived_keys")
+            _create_archived_keys(c)
+
+        if version < SCHEMA_VERSION:
+            c.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
         conn.commit()
-        conn.close()
+        self.sync_archived_keys()
 
     # ------------------------------------------------------------------
     # CRUD
     # ------------------------------------------------------------------
     def job_exists(self, job_id: str) -> bool:
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn
         c = conn.cursor()
         c.execute("SELECT 1 FROM jobs WHERE job_id = ?", (job_id,))
         exists = c.fetchone() is not None
-        conn.close()
         return exists
 
     def is_archived(self, job_id: str) -> bool:
         """Check if a specific job_id is archived."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn
         c = conn.cursor()
         c.execute("SELECT archived FROM jobs WHERE job_id = ?", (job_id,))
         row = c.fetchone()
-        conn.close()
         return row is not None and row[0] == 1
 
-    def get_archived_keys(self) -> Set[str]:
+    def get_archived_keys(self) -> Set[Tuple[str, str]]:
         """Get all archived title+company combos (normalized) so the scraper
         can skip them even when the job reappears with a different job_id.
-        Returns set of 'normalized_title|||normalized_company' strings."""
-        conn = sqlite3.connect(self.db_path)
+        Returns set of (normalized_title, normalized_company) tuples."""
+        conn = self._conn
         c = conn.cursor()
-        c.execute("SELECT title, company FROM jobs WHERE archived = 1")
-        keys = set()
-        for row in c.fetchall():
-            title = (row[0] or '').lower().strip()
-            company = (row[1] or '').lower().strip()
-            if company.startswith('the '):
-                company = company[4:]
-            keys.add(f"{title}|||{company}")
-        conn.close()
+        c.execute("SELECT DISTINCT norm_key FROM archived_keys")
+        keys = {tuple(row[0].split("|||", 1)) for row in c}
         return keys
 
-    def add_job(self, job: Dict) -> bool:
-        """Add job to database. Returns True if new, False if duplicate/archived."""
-        job_id = job.get("job_id")
-
-        if self.job_exists(job_id):
-            # Job exists — update last_seen but DON'T un-archive
-            conn = sqlite3.connect(self.db_path)
-            c = conn.cursor()
-            c.execute(
-                "UPDATE jobs SET last_seen = ? WHERE job_id = ? AND (archived = 0 OR archived IS NULL)",
-                (datetime.now(), job_id),
+    def sync_archived_keys(self) -> int:
+        """Add keys for archived jobs that don't have one yet (archived since
+        the last sync, from any connection). Returns how many were added."""
+        with self._conn as conn:
+            rows = conn.execute(
+                "SELECT job_id, title, company FROM jobs WHERE archived = 1 "
+                "AND NOT EXISTS (SELECT 1 FROM archived_keys k WHERE k.job_id = jobs.job_id)"
+            ).fetchall()
+            conn.executemany(
+                "INSERT OR IGNORE INTO archived_keys (norm_key, job_id) VALUES (?, ?)",
+                [(_archived_key(title, company), job_id) for job_id, title, company in rows],
             )
-            conn.commit()
-            conn.close()
-            return False
+        return len(rows)
 
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        c.execute(
-            """INSERT INTO jobs (
-                job_id, company, title, location, url, description,
-                posted_date, source, score, score_explanation,
-                first_seen, last_seen, notified, status, archived
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (
-                job_id,
-                job.get("company"),
-                job.get("title"),
-                job.get("location"),
-                job.get("url"),
-                job.get("description"),
-                job.get("posted_date"),
-                job.get("source"),
-                job.get("score", 0),
-                job.get("score_explanation", ""),
-                datetime.now(),
-                datetime.now(),
-                0,
-                "new",
-                0,
-            ),
+    def count_archived_keys(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM archived_keys").fetchone()[0]
+
+    def archived_among(self, keys: Iterable[Tuple[str, str]],
+                       chunk_size: int = 500) -> Set[Tuple[str, str]]:
+        """Subset of `keys` ((title, company) tuples) that are archived —
+        primary-key probes per chunk, so the scraper never holds every
+        archived key. The 'title|||company' join only exists at the SQL edge."""
+        norm = ["|||".join(k) for k in keys]
+        found = set()
+        for i in range(0, len(norm), chunk_size):
+            chunk = norm[i:i + chunk_size]
+            found.update(tuple(row[0].split("|||", 1)) for row in self._conn.execute(
+                f"SELECT DISTINCT norm_key FROM archived_keys WHERE norm_key IN ({','.join('?' * len(chunk))})",
+                chunk,
+            ))
+        return found
+
+    def cached_scores(self, keys: List[str],
+                      chunk_size: int = 500) -> Dict[str, Tuple[float, str]]:
+        """cache_key → (score, explanation) for the keys already scored."""
+        found = {}
+        for i in range(0, len(keys), chunk_size):
+            chunk = keys[i:i + chunk_size]
+            found.update((row[0], (row[1], row[2])) for row in self._conn.execute(
+                "SELECT cache_key, score, score_explanation FROM score_cache "
+                f"WHERE cache_key IN ({','.join('?' * len(chunk))})",
+                chunk,
+            ))
+        return found
+
+    def save_scores(self, rows: Iterable[Tuple[str, float, str]]):
+        """Store (cache_key, score, explanation) rows in one transaction;
+        keys already cached just get their last_used bumped."""
+        now = _now()
+        with self._conn as conn:
+            conn.executemany(SQL_SAVE_SCORE, (
+                (key, score, explanation, now) for key, score, explanation in rows
+            ))
+
+    def prune_score_cache(self, days: int = SCORE_CACHE_DAYS) -> int:
+        """Drop cached scores no scrape has used in `days` days."""
+        cutoff = datetime.now() - timedelta(days=days)
+        with self._conn as conn:
+            return conn.execute(
+                "DELETE FROM score_cache WHERE last_used < ?", (cutoff,)
+            ).rowcount
+
+    @staticmethod
+    def _job_row(job: Dict, now: str) -> tuple:
+        return (
+            job.get("job_id"),
+            job.get("company"),
+            job.get("title"),
+            job.get("location"),
+            job.get("url"),
+            job.get("description"),
+            job.get("posted_date"),
+            job.get("source"),
+            job.get("score", 0),
+            job.get("score_explanation", ""),
+            now,
+            now,
+            0,
+            "new",
+            0,
         )
-        conn.commit()
-        conn.close()
-        return True
+
+    def _upsert_job(self, job: Dict, now: str) -> bool:
+        """Insert, or bump last_seen on a live duplicate but DON'T un-archive.
+        True only if this statement inserted the row (see SQL_UPSERT_JOB)."""
+        row = self._conn.execute(SQL_UPSERT_JOB, self._job_row(job, now)).fetchone()
+        return bool(row and row[0])
+
+    def add_job(self, job: Dict) -> bool:
+        """Add job to database. Returns True if new, False if duplicate/archived."""
+        is_new = self._upsert_job(job, _now())
+        self._conn.commit()
+        return is_new
+
+    def add_jobs_bulk(self, jobs: List[Dict]) -> List[bool]:
+        """add_job for a whole batch in one transaction (one commit).
+        Returns a parallel list of is-new flags."""
+        now = _now()
+        upsert = self._upsert_job
+        with self._conn:
+            # A job_id repeated within the batch conflicts with its own first
+            # insert (times_seen 2), so only the first occurrence is new
+            return [upsert(job, now) for job in jobs]
 
     def mark_as_notified(self, job_id: str):
-        conn = sqlite3.connect(self.db_path)
-        conn.execute("UPDATE jobs SET notified = 1 WHERE job_id = ?", (job_id,))
+        conn = self._conn
+        conn.execute(SQL_MARK_NOTIFIED, (job_id,))
         conn.commit()
-        conn.close()
 
-    def get_unnotified_jobs(self, min_score: float = 50) -> List[Dict]:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        rows = conn.execute(
-            "SELECT * FROM jobs WHERE notified = 0 AND score >= ? AND (archived = 0 OR archived IS NULL) ORDER BY score DESC, first_seen DESC",
+    def mark_many_as_notified(self, job_ids: List[str]):
+        """mark_as_notified for a batch, in one transaction."""
+        with self._conn as conn:
+            conn.executemany(SQL_MARK_NOTIFIED, ((job_id,) for job_id in job_ids))
+
+    def get_unnotified_jobs(self, min_score: float = 50) -> List[UnnotifiedJob]:
+        conn = self._conn
+        cur = conn.execute(
+            f"SELECT {', '.join(UnnotifiedJob._fields)} FROM jobs "
+            "WHERE notified = 0 AND score >= ? AND (archived = 0 OR archived IS NULL) "
+            "ORDER BY score DESC, first_seen DESC",
             (min_score,),
-        ).fetchall()
-        jobs = [dict(r) for r in rows]
-        conn.close()
+        )
+        jobs = list(map(UnnotifiedJob._make, cur))
         return jobs
 
     def log_scrape(self, companies_scraped: int, jobs_found: int, new_jobs: int, errors: int):
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn
         conn.execute(
             "INSERT INTO scrape_log (timestamp, companies_scraped, jobs_found, new_jobs, errors) VALUES (?, ?, ?, ?, ?)",
             (datetime.now(), companies_scraped, jobs_found, new_jobs, errors),
         )
         conn.commit()
-        conn.close()
 
     def get_stats(self) -> Dict:
         """Quick stats for logging."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn
         total = conn.execute(
             "SELECT COUNT(*) FROM jobs WHERE (archived = 0 OR archived IS NULL)"
         ).fetchone()[0]
         above_threshold = conn.execute(
             "SELECT COUNT(*) FROM jobs WHERE score >= 20 AND (archived = 0 OR archived IS NULL)"
         ).fetchone()[0]
-        conn.close()
         return {"total": total, "above_threshold": above_threshold}
\ No newline at end of file
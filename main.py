@@ -2,8 +2,9 @@
 
 import yaml
 import time
-from datetime import datetime
+from datetime import datetime, timedelta
 from scraper import JobScraper
+from database.db import JobDatabase
 import json
 import os
 
@@ -11,7 +12,33 @@ import os
 def load_config(config_path='config.yaml'):
     """Load configuration from YAML"""
     with open(config_path, 'r') as f:
-        return yaml.safe_load(f)
+        config = yaml.safe_load(f)
+    return compile_schedule(config)
+
+
+def _to_minutes(hhmm):
+    """Convert 'HH:MM' to minutes since midnight (None if not a time)"""
+    try:
+        hour, minute = map(int, hhmm.split(':'))
+        return hour * 60 + minute
+    except (AttributeError, ValueError):
+        return None
+
+
+def compile_schedule(config):
+    """Pre-parse every 'HH:MM' in the config once so the scheduler loop
+    only compares integers:
+      - key_config['_sched_min']          (None for backup keys)
+      - config['schedule']['_run_minutes'] (sorted)
+    """
+    for key_config in config.get('rapidapi_keys', []):
+        sched = key_config.get('schedule_time', '')
+        key_config['_sched_min'] = None if sched == 'backup' else _to_minutes(sched)
+
+    schedule = config.setdefault('schedule', {})
+    run_minutes = (_to_minutes(t) for t in schedule.get('run_times', []))
+    schedule['_run_minutes'] = sorted(m for m in run_minutes if m is not None)
+    return config
 
 
 def get_usage_tracker_path():
@@ -19,21 +46,39 @@ def get_usage_tracker_path():
     return './database/api_usage.json'
 
 
+# In-process copy of the usage tracker, re-read only when the file changes
+_TRACKER_CACHE = None
+_TRACKER_MTIME = None
+
+
 def load_usage_tracker():
-    """Load API usage tracker"""
+    """Load API usage tracker (cached until the file's mtime changes)"""
+    global _TRACKER_CACHE, _TRACKER_MTIME
     path = get_usage_tracker_path()
-    if os.path.exists(path):
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        _TRACKER_CACHE, _TRACKER_MTIME = {}, None
+        return _TRACKER_CACHE
+
+    if _TRACKER_CACHE is None or mtime != _TRACKER_MTIME:
         with open(path, 'r') as f:
-            return json.load(f)
-    return {}
+            _TRACKER_CACHE = json.load(f)
+        _TRACKER_MTIME = mtime
+    return _TRACKER_CACHE
 
 
 def save_usage_tracker(tracker):
-    """Save API usage tracker"""
+    """Save API usage tracker (atomic temp file + rename)"""
+    global _TRACKER_CACHE, _TRACKER_MTIME
     path = get_usage_tracker_path()
     os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, 'w') as f:
+    tmp = path + '.tmp'
+    with open(tmp, 'w') as f:
         json.dump(tracker, f, indent=2)
+    os.replace(tmp, path)
+    _TRACKER_CACHE = tracker
+    _TRACKER_MTIME = os.path.getmtime(path)
 
 
 def get_current_month_key():
@@ -79,17 +124,13 @@ def get_api_key_for_time(config):
     best_key = None
     best_diff = float('inf')
     for key_config in keys:
-        sched = key_config.get('schedule_time', '')
-        if sched == 'backup':
-            continue
-        try:
-            sh, sm = map(int, sched.split(':'))
-            diff = abs(current_minutes - (sh * 60 + sm))
-            if diff < best_diff:
-                best_diff = diff
-                best_key = key_config
-        except Exception:
+        sched_min = key_config.get('_sched_min')
+        if sched_min is None:
             continue
+        diff = abs(current_minutes - sched_min)
+        if diff < best_diff:
+            best_diff = diff
+            best_key = key_config
 
     if best_key:
         return best_key
@@ -105,17 +146,13 @@ def get_api_key_for_time(config):
 def should_run_now(config):
     """Check if we should run at current time"""
     now = datetime.now()
-    current_time = now.strftime('%H:%M')
     
-    run_times = config.get('schedule', {}).get('run_times', [])
+    run_minutes = config.get('schedule', {}).get('_run_minutes', [])
     
     # Check if current time matches any scheduled run time (within 5 minute window)
-    for run_time in run_times:
-        # Parse run time
-        run_hour, run_minute = map(int, run_time.split(':'))
-        
+    for run_min in run_minutes:
         # Check if we're within 5 minutes of scheduled time
-        if now.hour == run_hour and abs(now.minute - run_minute) < 5:
+        if now.hour == run_min // 60 and abs(now.minute - run_min % 60) < 5:
             return True
     
     return False
@@ -126,16 +163,10 @@ def get_next_run_time(config):
     now = datetime.now()
     current_minutes = now.hour * 60 + now.minute
     
-    run_times = config.get('schedule', {}).get('run_times', [])
-    
-    # Convert run times to minutes
-    run_minutes = []
-    for run_time in run_times:
-        hour, minute = map(int, run_time.split(':'))
-        run_minutes.append(hour * 60 + minute)
+    run_minutes = config.get('schedule', {}).get('_run_minutes', [])
     
     # Find next run time
-    for run_min in sorted(run_minutes):
+    for run_min in run_minutes:
         if run_min > current_minutes:
             hours = run_min // 60
             minutes = run_min % 60
@@ -143,7 +174,7 @@ def get_next_run_time(config):
     
     # If no more runs today, return first run tomorrow
     if run_minutes:
-        first_run = min(run_minutes)
+        first_run = run_minutes[0]
         hours = first_run // 60
         minutes = first_run % 60
         return f"{hours:02d}:{minutes:02d} (tomorrow)"
@@ -151,6 +182,19 @@ def get_next_run_time(config):
     return "Unknown"
 
 
+def get_next_run_datetime(run_minutes, now=None):
+    """Get the datetime of the next scheduled run strictly after now.
+    run_minutes must be sorted minutes-since-midnight (see compile_schedule).
+    """
+    now = now or datetime.now()
+    midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    for run_min in run_minutes:
+        candidate = midnight + timedelta(minutes=run_min)
+        if candidate > now:
+            return candidate
+    return midnight + timedelta(days=1, minutes=run_minutes[0])
+
+
 def run_scheduler():
     """Main scheduler loop"""
     
@@ -179,90 +223,81 @@ def run_scheduler():
     print(f"Next scheduled run: {next_run}")
     print("=" * 80 + "\n")
     
-    last_run_day = None
-    last_run_hour = None
+    # The loop sleeps straight until the next slot
+    run_minutes = config['schedule']['_run_minutes']
+    if not run_minutes:
+        print("ERROR: No run times configured!")
+        return
+    
+    # Open (and migrate) the database once, not on every run
+    db = JobDatabase(config.get("database_path"))
     
     while True:
         try:
+            next_dt = get_next_run_datetime(run_minutes)
+            time.sleep(max(1, (next_dt - datetime.now()).total_seconds()))
             now = datetime.now()
-            current_day = now.date()
-            current_hour = now.hour
             
-            # Check if we should run now
-            if should_run_now(config):
-                # Prevent duplicate runs in same hour
-                if last_run_day == current_day and last_run_hour == current_hour:
-                    print(f"[{now.strftime('%H:%M:%S')}] Already ran this hour, skipping...")
-                    time.sleep(60)
-                    continue
-                
-                # Get API key for this time slot
-                key_config = get_api_key_for_time(config)
-                
-                if not key_config:
-                    print("ERROR: No API key configured!")
-                    time.sleep(300)
-                    continue
-                
-                # Check usage limit
-                usage = get_usage_count(key_config['name'])
-                if usage >= 25:
-                    print(f"\n⚠️  WARNING: {key_config['name']} has used {usage}/25 requests this month!")
-                    print("Skipping this run. Consider using backup key or waiting for next month.")
-                    time.sleep(300)
-                    continue
-                
-                print(f"\n{'=' * 80}")
-                print(f"[{now.strftime('%H:%M:%S')}] STARTING SCRAPE RUN")
-                print(f"API Key: {key_config['name']} (Usage: {usage}/25)")
-                print(f"{'=' * 80}\n")
-                
-                # Update config with selected key
-                config['rapidapi_key'] = key_config['key']
-                config['rapidapi_key_name'] = key_config['name']
-                
-                # Initialize scraper with selected key
-                scraper = JobScraper(config)
-                
-                # Scrape
-                results = scraper.scrape_all()
-                
-                # Increment usage
-                new_usage = increment_usage(key_config['name'])
-                
-                # Notify
-                scraper.notify_new_jobs(is_daytime=True)
-                
-                print(f"\n{'=' * 80}")
-                print(f"[{now.strftime('%H:%M:%S')}] SCRAPE COMPLETE")
-                print(f"{'=' * 80}")
-                print(f"  - API Key: {key_config['name']} → {new_usage}/25 requests used")
-                print(f"  - Companies scraped: {results['companies_scraped']}")
-                print(f"  - Total jobs found: {results['total_jobs']}")
-                print(f"  - NEW jobs: {len(results['new_jobs'])}")
-                print(f"  - Errors: {results['errors']}")
-                
-                if results['new_jobs']:
-                    print(f"\n✉️  Sent {len(results['new_jobs'])} email alerts")
-                
-                # Update last run tracking
-                last_run_day = current_day
-                last_run_hour = current_hour
-                
-                # Show next run time
-                next_run = get_next_run_time(config)
-                print(f"\n⏰ Next scheduled run: {next_run}\n")
+            # Get API key for this time slot
+            key_config = get_api_key_for_time(config)
+            
+            if not key_config:
+                print("ERROR: No API key configured!")
+                continue
+            
+            # Check usage limit
+            usage = get_usage_count(key_config['name'])
+            if usage >= 25:
+                print(f"\n⚠️  WARNING: {key_config['name']} has used {usage}/25 requests this month!")
+                print("Skipping this run. Consider using backup key or waiting for next month.")
+                continue
+            
+            print(f"\n{'=' * 80}")
+            print(f"[{now.strftime('%H:%M:%S')}] STARTING SCRAPE RUN")
+            print(f"API Key: {key_config['name']} (Usage: {usage}/25)")
+            print(f"{'=' * 80}\n")
+            
+            # Update config with selected key
+            config['rapidapi_key'] = key_config['key']
+            config['rapidapi_key_name'] = key_config['name']
+            
+            # Initialize scraper with selected key
+            scraper = JobScraper(config, db=db)
+            
+            # Scrape
+            results = scraper.scrape_all()
+            
+            # Increment usage
+            new_usage = increment_usage(key_config['name'])
+            
+            # Notify
+            scraper.notify_new_jobs(is_daytime=True)
+            
+            print(f"\n{'=' * 80}")
+            print(f"[{now.strftime('%H:%M:%S')}] SCRAPE COMPLETE")
+            print(f"{'=' * 80}")
+            print(f"  - API Key: {key_config['name']} → {new_usage}/25 requests used")
+            print(f"  - Companies scraped: {results['companies_scraped']}")
+            print(f"  - Total jobs found: {results['total_jobs']}")
+            print(f"  - NEW jobs: {len(results['new_jobs'])}")
+            print(f"  - Errors: {results['errors']}")
+            
+            if results['new_jobs']:
+                print(f"\n✉️  Sent {len(results['new_jobs'])} email alerts")
+            
+            # Refresh planner stats while idle until the next slot
+            db.optimize()
             
-            # Check every minute
-            time.sleep(60)
+            # Show next run time
+            next_run = get_next_run_time(config)
+            print(f"\n⏰ Next scheduled run: {next_run}\n")
             
         except KeyboardInterrupt:
             print("\n\nScheduler stopped by user")
             break
         except Exception as e:
             print(f"\n❌ Error in scheduler: {e}")
-            print("Continuing in 60 seconds...")
-            time.sleep(60)
+            print("Waiting for the next scheduled run...")
 
 
 def run_once():
@@ -2,12 +2,19 @@
 Uses ONE RapidAPI key per run (not all at once).
 """
 
-import pandas as pd
-import hashlib
-from typing import List, Dict, Set
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import csv
+import heapq
+import multiprocessing
+import os
+import re
+import time
+from collections import Counter
+from functools import lru_cache
+from typing import List, Dict, Set, Tuple, Optional
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, TimeoutError, as_completed, wait
 from datetime import datetime
 
+from api_clients.base import make_session
 from api_clients.greenhouse import GreenhouseClient
 from api_clients.lever_workday import LeverClient, WorkdayClient
 from api_clients.activejobs import ActiveJobsClient
@@ -17,7 +24,7 @@ from api_clients.adzuna import AdzunaClient
 from api_clients.remotive import RemotiveClient
 from api_clients.simplifyjobs import SimplifyJobsClient
 from api_clients.internships import InternshipsAPIClient
-from database.db import JobDatabase
+from database.db import JobDatabase, norm_field
 from utils.scorer import JobScorer
 from utils.notifier import EmailNotifier
 
@@ -28,39 +35,95 @@ REJECT_PREFIXES = (
     'executive ', 'distinguished ',
 )
 
+# All prefixes as one anchored alternation. Titles arrive already lowercased
+# (_title_norm), so a plain case-sensitive match is enough.
+_SENIOR_RE = re.compile('(?:' + '|'.join(map(re.escape, REJECT_PREFIXES)) + ')')
+# First letters of the prefixes — most titles fail this before touching the regex
+_SENIOR_FIRST_CHARS = frozenset(p[0] for p in REJECT_PREFIXES)
 
-def _dedup_key(job: Dict) -> str:
-    """Generate a dedup hash from normalized title + company."""
-    title = job.get('title', '').lower().strip()
-    company = job.get('company', '').lower().strip()
-    for prefix in ('the ', ):
-        if company.startswith(prefix):
-            company = company[len(prefix):]
-    raw = f"{title}|{company}"
-    return hashlib.md5(raw.encode()).hexdigest()
+
+# Shared stand-in for companies missing from the H1B table — read-only, so
+# one instance serves every lookup miss
+_NO_H1B: Dict = {}
+
+# Seconds a source may run (from the start of the fetch phase) before the scrape
+# moves on without it. Per-source overrides: config["source_timeouts"][name].
+SOURCE_TIMEOUT = 300
+
+# Sources that fan out (Lever) stop collecting this much earlier (at most a
+# quarter of their limit), so whatever finished in time still reaches the
+# scrape before its deadline
+SOURCE_GRACE = 5
+
+# Batches at least this big are scored on a process pool (scoring is CPU-bound)
+PROCESS_SCORING_MIN = 200
+
+# Set once per scoring worker process by _init_score_worker
+_worker_scorer: Optional[JobScorer] = None
+
+
+def _init_score_worker(scorer: JobScorer):
+    global _worker_scorer
+    _worker_scorer = scorer
+
+
+def _score_one(job: Dict, h1b: Dict) -> Tuple[float, str]:
+    result = _worker_scorer.score(job, h1b)
+    # Score-0 jobs are dropped right after scoring — never explain them
+    return result.score, result.explanation if result.score > 0 else ""
+
+
+def _normalize(job: Dict) -> Dict:
+    """Attach lowercased/stripped title + company once; everything downstream reads these."""
+    if '_title_norm' not in job:
+        # Same normalization as the DB's archived_keys (None → '')
+        job['_title_norm'] = norm_field(job.get('title'))
+        job['_company_norm'] = norm_field(job.get('company'))
+    return job
+
+
+def _dedup_key(job: Dict) -> Tuple[str, str]:
+    """Dedup key from normalized title + company (tuples hash in C — no digest needed)."""
+    _normalize(job)
+    return (job['_title_norm'], job['_company_norm'].removeprefix('the '))
+
+
+def _to_float(value) -> float:
+    """CSV cell → number; blanks and junk count as 0."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
 
 
 def _is_senior(title: str) -> bool:
-    t = title.lower().strip()
-    return any(t.startswith(p) for p in REJECT_PREFIXES)
+    """`title` should already be lowercased + stripped (e.g. job['_title_norm'])."""
+    if not title or title[0] not in _SENIOR_FIRST_CHARS:
+        return False
+    return _SENIOR_RE.match(title) is not None
 
 
 class JobScraper:
     """Main scraper orchestrator — 9 sources."""
 
-    def __init__(self, config: Dict):
+    def __init__(self, config: Dict, db: JobDatabase = None):
         self.config = config
 
-        # Core components
-        self.db = JobDatabase(config.get("database_path"))
+        # Core components (the scheduler passes in one long-lived db)
+        self.db = db or JobDatabase(config.get("database_path"))
         self.scorer = JobScorer(config.get("resume_path"))
         self.notifier = EmailNotifier(config.get("email"))
 
+        # One keep-alive HTTP session for every client — connections (and TLS
+        # sessions) to each API host are reused across every source in the run
+        self.http = make_session()
+        http = self.http
+
         # ── Source 1: Greenhouse (1000+ companies, auto-validated) ──
-        self.greenhouse = GreenhouseClient()
+        self.greenhouse = GreenhouseClient(session=http)
 
         # ── Source 2: Lever (from companies CSV) ──
-        self.lever = LeverClient()
+        self.lever = LeverClient(session=http)
         self.workday = WorkdayClient()
 
         # ── Source 3: Active Jobs DB (RapidAPI — use ONE key per run) ──
@@ -71,320 +134,405 @@ class JobScraper:
         # IMPORTANT: ActiveJobsClient can rotate through all keys on 429.
         # The scheduler picks which key to START with each run.
         self.activejobs = (
-            ActiveJobsClient(rapidapi_key, rapidapi_key_name, all_keys)
+            ActiveJobsClient(rapidapi_key, rapidapi_key_name, all_keys, session=http)
             if rapidapi_key else None
         )
 
         # ── Source 4: The Muse (free, no key) ──
-        self.themuse = TheMuseClient()
+        self.themuse = TheMuseClient(session=http)
 
         # ── Source 5: SerpAPI / Google Jobs ──
         serpapi_key = config.get("serpapi_key", "")
-        self.serpapi = SerpAPIClient(serpapi_key) if serpapi_key else None
+        self.serpapi = SerpAPIClient(serpapi_key, session=http) if serpapi_key else None
 
         # ── Source 6: Adzuna ──
         adzuna_cfg = config.get("adzuna", {})
         adzuna_id = adzuna_cfg.get("app_id", "")
         adzuna_key = adzuna_cfg.get("app_key", "")
-        self.adzuna = AdzunaClient(adzuna_id, adzuna_key) if adzuna_id else None
+        self.adzuna = AdzunaClient(adzuna_id, adzuna_key, session=http) if adzuna_id else None
 
         # ── Source 7: Remotive (free, no key) ──
-        self.remotive = RemotiveClient()
+        self.remotive = RemotiveClient(session=http)
 
         # ── Source 8: SimplifyJobs GitHub (free, date-filtered) ──
-        self.simplifyjobs = SimplifyJobsClient()
+        self.simplifyjobs = SimplifyJobsClient(session=http)
 
         # ── Source 9: Internships API (RapidAPI, same keys as Active Jobs DB) ──
         if all_keys:
             intern_keys = {k.get('name', f'key_{i}'): k['key'] for i, k in enumerate(all_keys) if k.get('key')}
-            self.internships = InternshipsAPIClient(intern_keys) if intern_keys else None
+            self.internships = InternshipsAPIClient(intern_keys, session=http) if intern_keys else None
         elif rapidapi_key:
-            self.internships = InternshipsAPIClient({rapidapi_key_name: rapidapi_key})
+            self.internships = InternshipsAPIClient({rapidapi_key_name: rapidapi_key}, session=http)
         else:
             self.internships = None
 
-        # Load companies for H-1B data
-        self.companies = self.load_companies(config.get("companies_csv"))
-        self.h1b_data = self.load_h1b_data()
+        # Load companies + H-1B data (one pass over the CSV)
+        self.companies, self.h1b_data = self.load_companies(config.get("companies_csv"))
+        self._score_pool: Optional[ProcessPoolExecutor] = None
+
+        # Resolve each company's ATS client once. ATS_Type is free text
+        # (e.g. "Greenhouse/Lever (Likely)"), so match on substrings here.
+        ats_clients = {"lever": self.lever, "workday": self.workday}
+        for co in self.companies:
+            ats = co["ats_type"].lower()
+            co["_ats_client"] = next(
+                (client for key, client in ats_clients.items() if key in ats), None
+            )
 
     # ------------------------------------------------------------------
     # Company loading
     # ------------------------------------------------------------------
-    def load_companies(self, csv_path: str) -> List[Dict]:
-        df = pd.read_csv(csv_path)
+    def load_companies(self, csv_path: str) -> Tuple[List[Dict], Dict]:
+        """Read the companies CSV once → (companies list, H-1B lookup by lowercase name)."""
         companies = []
-        for _, row in df.iterrows():
-            companies.append({
-                "name": row["Company_Name"],
-                "h1b_score": row.get("H1B_Priority_Score", 0),
-                "new_hires": row.get("New_Hires_Approved_2025", 0),
-                "ats_type": row.get("ATS_Type", "Unknown"),
-                "state": row.get("State", ""),
-                "city": row.get("City", ""),
-            })
-        return companies
-
-    def load_h1b_data(self) -> Dict:
-        try:
-            df = pd.read_csv(self.config.get("companies_csv"))
-            h1b = {}
-            for _, row in df.iterrows():
-                h1b[row["Company_Name"].lower()] = {
-                    "New_Hires_Approved_2025": row.get("New_Hires_Approved_2025", 0),
-                    "Approval_Rate_%": row.get("Approval_Rate_%", 0),
+        h1b = {}
+        with open(csv_path, newline='', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                name = row.get("Company_Name") or ""
+                new_hires = _to_float(row.get("New_Hires_Approved_2025"))
+                companies.append({
+                    "name": name,
+                    "h1b_score": _to_float(row.get("H1B_Priority_Score")),
+                    "new_hires": new_hires,
+                    "ats_type": row.get("ATS_Type") or "Unknown",
+                    "state": row.get("State") or "",
+                    "city": row.get("City") or "",
+                })
+                h1b[name.lower()] = {
+                    "New_Hires_Approved_2025": new_hires,
+                    "Approval_Rate_%": _to_float(row.get("Approval_Rate_%")),
                 }
-            return h1b
-        except Exception:
-            return {}
+        return companies, h1b
 
     # ------------------------------------------------------------------
     # Scoring helper
     # ------------------------------------------------------------------
     def _score_jobs(self, jobs: List[Dict]) -> List[Dict]:
-        for job in jobs:
-            h1b = self.h1b_data.get(job.get("company", "").lower(), {})
-            job["score"] = self.scorer.score_job(job, h1b)
-            job["score_explanation"] = self.scorer.explain_score(job, job["score"])
+        h1b_get = self.h1b_data.get
+        h1b = [h1b_get(_normalize(job)["_company_norm"], _NO_H1B) for job in jobs]
+        # Jobs seen by an earlier run (same resume, same content) keep their score
+        cache_key = self.scorer.cache_key
+        keys = [cache_key(job, h) for job, h in zip(jobs, h1b)]
+        cached = self.db.cached_scores(keys)
+        todo = [i for i, key in enumerate(keys) if key not in cached]
+        self._score_uncached([jobs[i] for i in todo], [h1b[i] for i in todo])
+
+        for job, key in zip(jobs, keys):
+            hit = cached.get(key)
+            if hit is not None:
+                job["score"], job["score_explanation"] = hit
+        self.db.save_scores(
+            (key, job["score"], job["score_explanation"]) for job, key in zip(jobs, keys)
+        )
         return jobs
 
+    def _score_uncached(self, jobs: List[Dict], h1b: List[Dict]):
+        if len(jobs) < PROCESS_SCORING_MIN:
+            explain = self.scorer.explain_score
+            for job, score in zip(jobs, self.scorer.score_jobs(jobs, h1b)):
+                job["score"] = score
+                # Score-0 jobs are dropped by _store, so never explained
+                job["score_explanation"] = explain(job, score) if score > 0 else ""
+            return
+
+        results = self._get_score_pool().map(_score_one, jobs, h1b, chunksize=64)
+        for job, (score, explanation) in zip(jobs, results):
+            job["score"] = score
+            job["score_explanation"] = explanation
+
+    def _get_score_pool(self) -> ProcessPoolExecutor:
+        """Lazily start the scoring pool; each worker gets a copy of self.scorer.
+        spawn (not fork) because source threads are still running.
+
+        The pool lives for one scrape_all run only: main.py builds a fresh
+        JobScraper per scheduled run (the resume and scorer may have changed
+        in between), and idle spawn workers would otherwise sit in memory for
+        the hours between runs. Small runs never start it at all."""
+        if self._score_pool is None:
+            self._score_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_score_worker,
+                initargs=(self.scorer,),
+            )
+        return self._score_pool
+
+    def _shutdown_pool(self):
+        if self._score_pool is not None:
+            self._score_pool.shutdown(cancel_futures=True)
+            self._score_pool = None
+
+    # ------------------------------------------------------------------
+    # Sources — each runs on a worker thread →
+    # (name, jobs, error or None, failed sub-requests)
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _run_source(name: str, fetch) -> Tuple[str, List[Dict], Optional[Exception], int]:
+        try:
+            return name, fetch(), None, 0
+        except Exception as e:
+            return name, [], e, 0
+
+    def _lever_companies(self) -> List[Dict]:
+        return [c for c in self.companies if c["_ats_client"] is self.lever]
+
+    def _run_source_greenhouse(self, max_workers: int):
+        return self._run_source(
+            "Greenhouse", lambda: self.greenhouse.get_all_jobs(max_workers=max_workers)
+        )
+
+    def _run_source_lever(self, companies: List[Dict], max_workers: int, source_limit: float):
+        """Lever fans out per company on its own inner pool. A failing company
+        doesn't fail the source; failures are counted per run and returned
+        with the result, so a run the scrape stopped waiting for can't touch
+        any shared state. Collection stops SOURCE_GRACE before the source's
+        deadline: companies done by then are kept, stragglers count as failed
+        and are neither waited for nor started."""
+        time_limit = max(0.0, source_limit - min(SOURCE_GRACE, source_limit / 4))
+        lever_pool = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            futures = [lever_pool.submit(self.lever.get_jobs, co) for co in companies]
+            done, _ = wait(futures, timeout=time_limit)
+        finally:
+            lever_pool.shutdown(wait=False, cancel_futures=True)
+        jobs = []
+        failed = 0
+        # Collect in CSV order so dedup stays deterministic
+        for future in futures:
+            if future not in done:
+                failed += 1
+                continue
+            try:
+                jobs.extend(future.result() or [])
+            except Exception:
+                failed += 1
+        return "Lever", jobs, None, failed
+
+    def _run_source_themuse(self):
+        return self._run_source("The Muse", self.themuse.search_new_grad_software_jobs)
+
+    def _run_source_activejobs(self):
+        def fetch():
+            raw = self.activejobs.search_new_grad_software_jobs()
+            return [self.activejobs.parse_job(r) for r in raw]
+        return self._run_source("Active Jobs DB", fetch)
+
+    def _run_source_serpapi(self):
+        return self._run_source("SerpAPI", self.serpapi.get_all_jobs)
+
+    def _run_source_adzuna(self):
+        return self._run_source("Adzuna", self.adzuna.get_all_jobs)
+
+    def _run_source_remotive(self):
+        return self._run_source("Remotive", self.remotive.get_all_jobs)
+
+    def _run_source_simplifyjobs(self):
+        return self._run_source("SimplifyJobs", self.simplifyjobs.get_all_jobs)
+
+    def _run_source_internships(self):
+        return self._run_source("Internships API", self.internships.get_all_jobs)
+
     # ------------------------------------------------------------------
     # Main orchestrator
     # ------------------------------------------------------------------
     def scrape_all(self, max_workers: int = 10) -> Dict:
+        try:
+            return self._scrape_all(max_workers)
+        finally:
+            # Also on errors/KeyboardInterrupt, or the spawn workers leak
+            self._shutdown_pool()
+
+    def _scrape_all(self, max_workers: int) -> Dict:
         print("=" * 70)
         print(f"STARTING SCRAPE — {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"Sources: Greenhouse | Lever | ActiveJobsDB | TheMuse | "
               f"SerpAPI | Adzuna | Remotive | SimplifyJobs | Internships")
         print("=" * 70)
 
-        all_jobs: List[Dict] = []
         new_jobs: List[Dict] = []
+        high_score_jobs: List[Dict] = []
         errors = 0
         companies_scraped = 0
-        seen_hashes: Set[str] = set()
+        seen_keys: Set[Tuple[str, str]] = set()
 
-        # Load archived jobs so we never re-add them
-        archived_keys: Set[str] = set()
+        # Archived jobs are never re-added; they're looked up per batch (see
+        # _archived_in) rather than loaded into memory up front
         try:
-            archived_keys = self.db.get_archived_keys()
-            if archived_keys:
-                print(f"  📦 Loaded {len(archived_keys)} archived jobs (will skip)")
+            # Pick up jobs archived since the last run (dashboard, cleanup.py)
+            self.db.sync_archived_keys()
+            archived_count = self.db.count_archived_keys()
+            if archived_count:
+                print(f"  📦 {archived_count} archived jobs in the database (will skip)")
         except Exception:
             pass
 
-        def _is_archived(job: Dict) -> bool:
-            title = job.get('title', '').lower().strip()
-            company = job.get('company', '').lower().strip()
-            if company.startswith('the '):
-                company = company[4:]
-            return f"{title}|||{company}" in archived_keys
-
-        def _add_jobs(jobs: List[Dict]):
-            added = 0
-            skipped_archived = 0
-            for job in jobs:
-                if _is_archived(job):
+        # Running totals — each source's jobs are stored and then dropped,
+        # so nothing but the dedup keys outlives its own batch
+        deduped = senior_removed = zero_removed = above_threshold = final_count = 0
+        src_counts = Counter()
+
+        def _archived_in(keys: Set[Tuple[str, str]]) -> Set[Tuple[str, str]]:
+            """Which of this batch's keys are archived (one indexed query per chunk)."""
+            try:
+                return self.db.archived_among(keys)
+            except Exception:
+                return set()
+
+        def _dedup(jobs: List[Dict]):
+            """→ (unseen non-senior jobs, skipped summary line)."""
+            nonlocal deduped, senior_removed
+            fresh = []
+            added = seniors = skipped_archived = 0
+            keys = [_dedup_key(job) for job in jobs]
+            archived_keys = _archived_in(set(keys))
+            # Hot loop: bound methods hoisted to locals, counters kept local
+            add_seen, keep, is_senior = seen_keys.add, fresh.append, _is_senior
+            for job, key in zip(jobs, keys):
+                if key in archived_keys:
                     skipped_archived += 1
                     continue
-                h = _dedup_key(job)
-                if h not in seen_hashes:
-                    seen_hashes.add(h)
-                    all_jobs.append(job)
+                if key not in seen_keys:
+                    add_seen(key)
                     added += 1
+                    # Senior roles are dropped here so they never get scored
+                    if is_senior(job['_title_norm']):
+                        seniors += 1
+                    else:
+                        keep(job)
+            deduped += added
+            senior_removed += seniors
             dupes = len(jobs) - added - skipped_archived
             parts = []
             if dupes > 0:
                 parts.append(f"{dupes} duplicates")
             if skipped_archived > 0:
                 parts.append(f"{skipped_archived} archived")
-            if parts:
-                print(f"    (skipped: {', '.join(parts)})")
-            return added
-
-        # ── 1/9: Greenhouse ──
-        print(f"\n{'─'*50}")
-        print(f"1/9  🏢 Greenhouse (1000+ company boards)")
-        print(f"{'─'*50}")
-        try:
-            gh_jobs = self.greenhouse.get_all_jobs()
-            gh_jobs = self._score_jobs(gh_jobs)
-            _add_jobs(gh_jobs)
-            companies_scraped += len(self.greenhouse._valid_tokens or {})
-        except Exception as e:
-            print(f"  ✗ Greenhouse error: {e}")
-            errors += 1
-
-        # ── 2/9: Lever ──
-        lever_companies = [
-            c for c in self.companies
-            if 'lever' in c.get('ats_type', '').lower()
+            return fresh, (f"    (skipped: {', '.join(parts)})" if parts else "")
+
+        def _store(batch: List[Dict]):
+            """Score one source's survivors, drop score-0, write to the DB."""
+            nonlocal zero_removed, above_threshold, final_count
+            kept = []
+            for j in self._score_jobs(batch):
+                score = j.get("score", 0)
+                if score <= 0:
+                    zero_removed += 1
+                    continue
+                kept.append(j)
+                if score >= 20:
+                    above_threshold += 1
+                if score >= 40:
+                    high_score_jobs.append(j)
+                src_counts[_consolidate_source(j.get('source', 'Unknown'))] += 1
+            final_count += len(kept)
+            # One transaction per source
+            for job, is_new in zip(kept, self.db.add_jobs_bulk(kept)):
+                if is_new:
+                    new_jobs.append(job)
+
+        lever_companies = self._lever_companies()
+        timeouts = self.config.get("source_timeouts") or {}
+
+        # (header, name, runner, companies scraped on success).
+        # List order is the dedup priority when the same job shows up twice.
+        sources = [
+            ("1/9  🏢 Greenhouse (1000+ company boards)", "Greenhouse",
+             lambda: self._run_source_greenhouse(max_workers),
+             lambda: len(self.greenhouse._valid_tokens or {})),
+            (f"2/9  🔧 Lever ({len(lever_companies)} companies)", "Lever",
+             lambda: self._run_source_lever(lever_companies, self.lever.max_workers,
+                                            timeouts.get("Lever", SOURCE_TIMEOUT)),
+             lambda: len(lever_companies)),
+            ("3/9  🎭 The Muse (5,000+ companies)", "The Muse", self._run_source_themuse, lambda: 1),
         ]
-        print(f"\n{'─'*50}")
-        print(f"2/9  🔧 Lever ({len(lever_companies)} companies)")
-        print(f"{'─'*50}")
-        lever_total = 0
-        for co in lever_companies:
-            try:
-                jobs = self.lever.get_jobs(co)
-                if jobs:
-                    jobs = self._score_jobs(jobs)
-                    _add_jobs(jobs)
-                    lever_total += len(jobs)
-            except Exception as e:
-                errors += 1
-        companies_scraped += len(lever_companies)
-        print(f"  → Lever: {lever_total} jobs")
-
-        # ── 3/9: The Muse ──
-        print(f"\n{'─'*50}")
-        print(f"3/9  🎭 The Muse (5,000+ companies)")
-        print(f"{'─'*50}")
-        try:
-            muse_jobs = self.themuse.search_new_grad_software_jobs()
-            print(f"  ✓ The Muse: {len(muse_jobs)} jobs after filtering")
-            muse_jobs = self._score_jobs(muse_jobs)
-            _add_jobs(muse_jobs)
-            companies_scraped += 1
-        except Exception as e:
-            print(f"  ✗ The Muse error: {e}")
-            errors += 1
-
-        # ── 4/9: Active Jobs DB (single key — no rotation) ──
         if self.activejobs:
-            print(f"\n{'─'*50}")
-            print(f"4/9  ⚡ Active Jobs DB (120K+ companies)")
-            print(f"{'─'*50}")
-            try:
-                active_raw = self.activejobs.search_new_grad_software_jobs()
-                active_jobs = []
-                for raw in active_raw:
-                    active_jobs.append(self.activejobs.parse_job(raw))
-                active_jobs = self._score_jobs(active_jobs)
-                _add_jobs(active_jobs)
-                companies_scraped += 1
-                print(f"  ✓ Active Jobs DB: {len(active_jobs)} jobs")
-            except Exception as e:
-                print(f"  ✗ Active Jobs DB error: {e}")
-                errors += 1
-
-        # ── 5/9: SerpAPI / Google Jobs ──
+            sources.append(("4/9  ⚡ Active Jobs DB (120K+ companies)", "Active Jobs DB",
+                            self._run_source_activejobs, lambda: 1))
         if self.serpapi:
-            print(f"\n{'─'*50}")
-            print(f"5/9  🔍 Google Jobs via SerpAPI (LinkedIn, Indeed, Glassdoor...)")
-            print(f"{'─'*50}")
-            try:
-                serp_jobs = self.serpapi.get_all_jobs()
-                serp_jobs = self._score_jobs(serp_jobs)
-                _add_jobs(serp_jobs)
-                companies_scraped += 1
-            except Exception as e:
-                print(f"  ✗ SerpAPI error: {e}")
-                errors += 1
-
-        # ── 6/9: Adzuna ──
+            sources.append(("5/9  🔍 Google Jobs via SerpAPI (LinkedIn, Indeed, Glassdoor...)", "SerpAPI",
+                            self._run_source_serpapi, lambda: 1))
         if self.adzuna:
-            print(f"\n{'─'*50}")
-            print(f"6/9  📰 Adzuna (US job aggregator)")
-            print(f"{'─'*50}")
-            try:
-                adz_jobs = self.adzuna.get_all_jobs()
-                adz_jobs = self._score_jobs(adz_jobs)
-                _add_jobs(adz_jobs)
-                companies_scraped += 1
-            except Exception as e:
-                print(f"  ✗ Adzuna error: {e}")
-                errors += 1
-
-        # ── 7/9: Remotive ──
-        print(f"\n{'─'*50}")
-        print(f"7/9  🌍 Remotive (remote tech jobs)")
-        print(f"{'─'*50}")
-        try:
-            remote_jobs = self.remotive.get_all_jobs()
-            remote_jobs = self._score_jobs(remote_jobs)
-            _add_jobs(remote_jobs)
-            companies_scraped += 1
-        except Exception as e:
-            print(f"  ✗ Remotive error: {e}")
-            errors += 1
+            sources.append(("6/9  📰 Adzuna (US job aggregator)", "Adzuna", self._run_source_adzuna, lambda: 1))
+        sources.append(("7/9  🌍 Remotive (remote tech jobs)", "Remotive", self._run_source_remotive, lambda: 1))
+        sources.append(("8/9  📋 SimplifyJobs GitHub (last 7 days, SWE/AI only)", "SimplifyJobs",
+                        self._run_source_simplifyjobs, lambda: 1))
+        if self.internships:
+            sources.append(("9/9  🎓 Internships API (career sites + job boards)", "Internships API",
+                            self._run_source_internships, lambda: 1))
 
-        # ── 8/9: SimplifyJobs GitHub (date-filtered, SWE/AI only) ──
-        print(f"\n{'─'*50}")
-        print(f"8/9  📋 SimplifyJobs GitHub (last 7 days, SWE/AI only)")
-        print(f"{'─'*50}")
+        # ── Fetch every source concurrently ──
+        pool = ThreadPoolExecutor(max_workers=max_workers)
         try:
-            simplify_jobs = self.simplifyjobs.get_all_jobs()
-            simplify_jobs = self._score_jobs(simplify_jobs)
-            _add_jobs(simplify_jobs)
-            companies_scraped += 1
-        except Exception as e:
-            print(f"  ✗ SimplifyJobs error: {e}")
-            errors += 1
+            started = time.monotonic()
+            futures = [pool.submit(run) for _, _, run, _ in sources]
+
+            # Dedup stays single-threaded, in source order
+            for i, (header, name, _, scraped) in enumerate(sources):
+                limit = timeouts.get(name, SOURCE_TIMEOUT)
+                try:
+                    name, jobs, error, failed = futures[i].result(
+                        timeout=max(0.0, started + limit - time.monotonic()))
+                except TimeoutError:
+                    # Best effort — a request already in flight still runs to its
+                    # own socket timeout, but the scrape no longer waits for it
+                    futures[i].cancel()
+                    jobs, error, failed = None, f"no result after {limit}s, skipped", 0
+                # Each source's section is written in one go as soon as it is
+                # stored, so progress shows up live
+                section = [f"\n{'─'*50}", header, f"{'─'*50}"]
+                if error is not None:
+                    section.append(f"  ✗ {name} error: {error}")
+                    errors += 1
+                else:
+                    section.append(f"  ✓ {name}: {len(jobs)} jobs")
+                    errors += failed
+                    # A bad job costs only its own source, not the whole scrape
+                    try:
+                        fresh, skipped = _dedup(jobs)
+                        if skipped:
+                            section.append(skipped)
+                        _store(fresh)
+                        companies_scraped += scraped()
+                    except Exception as e:
+                        section.append(f"  ✗ {name} processing error: {e}")
+                        errors += 1
+                print("\n".join(section), flush=True)
+                # Release the batch (the Future holds a reference to it)
+                futures[i] = jobs = fresh = None
+        finally:
+            # Don't block on a source that overran its deadline
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        # ── Post-processing (report buffered, written once) ──
+        report = [
+            f"\n{'='*70}",
+            f"POST-PROCESSING",
+            f"{'='*70}",
+            f"Total raw (deduplicated): {deduped}",
+        ]
 
-        # ── 9/9: Internships API ──
-        if self.internships:
-            print(f"\n{'─'*50}")
-            print(f"9/9  🎓 Internships API (career sites + job boards)")
-            print(f"{'─'*50}")
-            try:
-                intern_jobs = self.internships.get_all_jobs()
-                intern_jobs = self._score_jobs(intern_jobs)
-                _add_jobs(intern_jobs)
-                companies_scraped += 1
-            except Exception as e:
-                print(f"  ✗ Internships API error: {e}")
-                errors += 1
-
-        # ── Post-processing ──
-        print(f"\n{'='*70}")
-        print(f"POST-PROCESSING")
-        print(f"{'='*70}")
-        print(f"Total raw (deduplicated): {len(all_jobs)}")
-
-        # Remove senior titles
-        before = len(all_jobs)
-        all_jobs = [j for j in all_jobs if not _is_senior(j.get('title', ''))]
-        senior_removed = before - len(all_jobs)
         if senior_removed:
-            print(f"🚫 Removed {senior_removed} senior/lead/staff/director roles")
-
-        # Drop score-0
-        before = len(all_jobs)
-        all_jobs = [j for j in all_jobs if j.get("score", 0) > 0]
-        zero_removed = before - len(all_jobs)
+            report.append(f"🚫 Removed {senior_removed} senior/lead/staff/director roles")
         if zero_removed:
-            print(f"🚫 Removed {zero_removed} score-0 jobs (non-matching)")
-
-        # Store in DB
-        for job in all_jobs:
-            is_new = self.db.add_job(job)
-            if is_new:
-                new_jobs.append(job)
+            report.append(f"🚫 Removed {zero_removed} score-0 jobs (non-matching)")
 
-        final_count = len(all_jobs)
-        above_threshold = len([j for j in all_jobs if j.get("score", 0) >= 20])
+        report.append(f"✅ Final count: {final_count} jobs")
+        report.append(f"⭐ Above threshold (20): {above_threshold}")
+        report.append(f"🆕 NEW jobs (first time seen): {len(new_jobs)}")
 
-        print(f"✅ Final count: {final_count} jobs")
-        print(f"⭐ Above threshold (20): {above_threshold}")
-        print(f"🆕 NEW jobs (first time seen): {len(new_jobs)}")
-
-        # Source breakdown
-        src_counts = {}
-        for j in all_jobs:
-            s = _consolidate_source(j.get('source', 'Unknown'))
-            src_counts[s] = src_counts.get(s, 0) + 1
-
-        print(f"\n📊 Source breakdown:")
-        for s, c in sorted(src_counts.items(), key=lambda x: -x[1]):
-            print(f"    {s:30s} {c:>5} jobs")
-        print(f"    {'TOTAL':30s} {final_count:>5} jobs")
+        report.append(f"\n📊 Source breakdown:")
+        for s, c in src_counts.most_common():
+            report.append(f"    {s:30s} {c:>5} jobs")
+        report.append(f"    {'TOTAL':30s} {final_count:>5} jobs")
+        print("\n".join(report))
 
         self.db.log_scrape(companies_scraped, final_count, len(new_jobs), errors)
+        self.db.prune_score_cache()
 
         return {
             "total_jobs": final_count,
             "new_jobs": new_jobs,
-            "high_score_jobs": [j for j in all_jobs if j.get("score", 0) >= 40],
+            "high_score_jobs": high_score_jobs,
             "companies_scraped": companies_scraped,
             "errors": errors,
         }
@@ -400,17 +548,26 @@ class JobScraper:
             print("No new jobs to notify")
             return
 
-        unnotified.sort(key=lambda x: x.get("score", 0), reverse=True)
-        top5 = unnotified[:5]
+        top5 = [j._asdict() for j in heapq.nlargest(5, unnotified, key=lambda x: x.score or 0)]
 
         print(f"📧 Sending digest with top {len(top5)} of {len(unnotified)} new jobs...")
-        self.notifier.send_digest(top5, total_new=len(unnotified))
+        with self.notifier:
+            self.notifier.send_digest(top5, total_new=len(unnotified))
+
+        self.db.mark_many_as_notified([job.job_id for job in unnotified])
+
 
-        for job in unnotified:
-            self.db.mark_as_notified(job["job_id"])
+# Raw source-name prefix → breakdown bucket (e.g. "Google Jobs (Indeed)")
+_SOURCE_PREFIX_MAP = {
+    'Google Jobs': 'Google Jobs',
+}
 
 
+@lru_cache(maxsize=64)
 def _consolidate_source(source: str) -> str:
-    if source and source.startswith('Google Jobs'):
-        return 'Google Jobs'
-    return source or 'Unknown'
\ No newline at end of file
+    if not source:
+        return 'Unknown'
+    for prefix, bucket in _SOURCE_PREFIX_MAP.items():
+        if source.startswith(prefix):
+            return bucket
+    return source
\ No newline at end of file
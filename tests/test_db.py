@@ -0,0 +1,93 @@
+"""JobDatabase tests — each runs against a fresh database in a temp dir.
+
+Run from the repo root: python -m unittest
+"""
+
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from database.db import JobDatabase
+
+
+def _job(job_id: str, title: str = "Software Engineer", company: str = "Acme") -> dict:
+    return {"job_id": job_id, "title": title, "company": company, "score": 50}
+
+
+class ArchivedKeysTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmp.name, "jobs.db")
+        self.db = JobDatabase(self.path)
+
+    def tearDown(self):
+        self.db.close()
+        self._tmp.cleanup()
+
+    def _raw(self) -> sqlite3.Connection:
+        """A plain connection with nothing registered, like the sqlite3 CLI."""
+        conn = sqlite3.connect(self.path)
+        self.addCleanup(conn.close)
+        return conn
+
+    def test_archive_from_plain_connection_is_picked_up(self):
+        self.db.add_job(_job("a", "ÉTUDES Engineer", "The ÉCOLE Inc"))
+        raw = self._raw()
+        raw.execute("UPDATE jobs SET archived = 1 WHERE job_id = 'a'")
+        raw.commit()
+
+        self.assertEqual(self.db.sync_archived_keys(), 1)
+        # Same key as the scraper's _dedup_key: Unicode lower(), no 'the '
+        key = ("études engineer", "école inc")
+        self.assertEqual(self.db.archived_among([key]), {key})
+
+    def test_unarchive_and_delete_remove_the_key(self):
+        self.db.add_jobs_bulk([_job("a"), _job("b")])
+        raw = self._raw()
+        raw.execute("UPDATE jobs SET archived = 1")
+        raw.commit()
+        self.db.sync_archived_keys()
+        key = ("software engineer", "acme")
+
+        raw.execute("UPDATE jobs SET archived = 0 WHERE job_id = 'a'")
+        raw.commit()
+        # 'b' still holds the same key
+        self.assertEqual(self.db.archived_among([key]), {key})
+
+        raw.execute("DELETE FROM jobs WHERE job_id = 'b'")
+        raw.commit()
+        self.assertEqual(self.db.archived_among([key]), set())
+        self.assertEqual(self.db.count_archived_keys(), 0)
+
+
+class UpsertTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.db = JobDatabase(os.path.join(self._tmp.name, "jobs.db"))
+
+    def tearDown(self):
+        self.db.close()
+        self._tmp.cleanup()
+
+    def test_mixed_batch_reports_only_inserted_jobs_as_new(self):
+        self.assertEqual(self.db.add_jobs_bulk([_job("old"), _job("gone")]), [True, True])
+        self.db._conn.execute("UPDATE jobs SET archived = 1 WHERE job_id = 'gone'")
+        self.db._conn.commit()
+
+        batch = [_job("old"), _job("x"), _job("gone"), _job("y"), _job("x")]
+        flags = self.db.add_jobs_bulk(batch)
+
+        self.assertEqual(flags, [False, True, False, True, False])
+        self.assertEqual(sum(flags), 2)
+        seen = dict(self.db._conn.execute(
+            "SELECT job_id, times_seen FROM jobs ORDER BY job_id"))
+        # The archived row is left alone
+        self.assertEqual(seen, {"gone": 1, "old": 2, "x": 2, "y": 1})
+        self.assertFalse(self.db.add_job(_job("y")))
+
+
+if __name__ == "__main__":
+    unittest.main()
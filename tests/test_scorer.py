@@ -0,0 +1,51 @@
+"""JobScorer tests.
+
+Run from the repo root: python -m unittest
+"""
+
+import unittest
+from unittest import mock
+
+from utils import scorer
+from utils.scorer import JobScorer
+
+
+JOB = {
+    "title": "Software Engineer, New Grad",
+    "company": "Stripe",
+    "description": "Python, React and SQL. We sponsor H1B visas.",
+}
+H1B = {"New_Hires_Approved_2025": 42.0}
+
+
+class ScoreCacheKeyTest(unittest.TestCase):
+
+    def _key(self) -> str:
+        return JobScorer(None).cache_key(dict(JOB), H1B)
+
+    def test_same_rules_same_key(self):
+        self.assertEqual(self._key(), self._key())
+
+    def test_changing_a_scoring_table_misses_the_cache(self):
+        before = self._key()
+        cases = [
+            ("SKILL_POINTS", scorer.SKILL_POINTS[:-1] + (35,)),
+            ("H1B_POINTS", scorer.H1B_POINTS[:-1] + (25,)),
+            ("COMPANY_TIERS", ((15, ("google",)),) + scorer.COMPANY_TIERS[1:]),
+            ("KNOWN_SKILLS", scorer.KNOWN_SKILLS | {"zig"}),
+            ("SENIOR_KEYWORDS", scorer.SENIOR_KEYWORDS + ["fellow"]),
+            ("CITIZENSHIP_PATTERNS", scorer.CITIZENSHIP_PATTERNS[1:]),
+        ]
+        for name, value in cases:
+            with self.subTest(table=name), mock.patch.object(scorer, name, value):
+                self.assertNotEqual(self._key(), before)
+        self.assertEqual(self._key(), before)
+
+    def test_h1b_hires_are_part_of_the_key(self):
+        s = JobScorer(None)
+        self.assertNotEqual(s.cache_key(dict(JOB), H1B),
+                            s.cache_key(dict(JOB), {"New_Hires_Approved_2025": 120.0}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+"""JobScraper tests — sources are stubbed, nothing touches the network.
+
+Run from the repo root: python -m unittest
+"""
+
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+from database.db import JobDatabase
+from scraper import JobScraper
+from utils.scorer import JobScorer
+
+
+class _Source:
+    """Stands in for a one-shot API client."""
+
+    def __init__(self, jobs=()):
+        self.jobs = list(jobs)
+        self._valid_tokens = {}
+
+    def get_all_jobs(self, **kwargs):
+        return self.jobs
+
+    search_new_grad_software_jobs = get_all_jobs
+
+
+class _Lever:
+    """Lever stand-in: one job per company; companies named 'hung' block
+    until released."""
+
+    max_workers = 4
+
+    def __init__(self):
+        self.release = threading.Event()
+
+    def get_jobs(self, co):
+        if co["name"] == "hung":
+            self.release.wait(30)
+            return []
+        return [{
+            "job_id": f"lever_{co['name']}",
+            "title": "Software Engineer, New Grad",
+            "company": co["name"],
+            "description": "python sql",
+            "url": "https://jobs.lever.co/x",
+            "source": "Lever",
+        }]
+
+
+class LeverDeadlineTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.lever = _Lever()
+        self.addCleanup(self._tmp.cleanup)
+        # Let the hung fetch finish so its worker thread can exit
+        self.addCleanup(self.lever.release.set)
+
+        s = JobScraper.__new__(JobScraper)
+        s.config = {"source_timeouts": {"Lever": 2}}
+        s.db = JobDatabase(os.path.join(self._tmp.name, "jobs.db"))
+        self.addCleanup(s.db.close)
+        s.scorer = JobScorer(None)
+        s.lever = self.lever
+        s.greenhouse = s.themuse = s.remotive = s.simplifyjobs = _Source()
+        s.activejobs = s.serpapi = s.adzuna = s.internships = None
+        s.h1b_data = {}
+        s._score_pool = None
+        names = ["alpha", "hung", "beta", "gamma"]
+        s.companies = [{"name": n, "_ats_client": self.lever} for n in names]
+        self.scraper = s
+
+    def test_runner_keeps_finished_companies_and_skips_the_hung_one(self):
+        started = time.monotonic()
+        name, jobs, error, failed = self.scraper._run_source_lever(
+            self.scraper.companies, 4, 2)
+        self.assertLess(time.monotonic() - started, 2)
+        self.assertIsNone(error)
+        self.assertEqual(failed, 1)
+        self.assertEqual([j["company"] for j in jobs], ["alpha", "beta", "gamma"])
+
+    def test_scrape_keeps_partial_lever_results(self):
+        results = self.scraper.scrape_all(max_workers=4)
+        self.assertEqual(results["total_jobs"], 3)
+        self.assertEqual(len(results["new_jobs"]), 3)
+        self.assertEqual(results["errors"], 1)
+
+
+class ScorePoolShutdownTest(unittest.TestCase):
+
+    def test_pool_is_shut_down_when_the_run_raises(self):
+        s = JobScraper.__new__(JobScraper)
+        pool = mock.Mock()
+        s._score_pool = pool
+        with mock.patch.object(JobScraper, "_scrape_all",
+                               side_effect=KeyboardInterrupt):
+            with self.assertRaises(KeyboardInterrupt):
+                s.scrape_all()
+        pool.shutdown.assert_called_once()
+        self.assertIsNone(s._score_pool)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,48 +1,33 @@
 """Email notification system"""
 
 import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+from email.message import EmailMessage
 from typing import List, Dict
 from datetime import datetime
 
-class EmailNotifier:
-    """Sends email notifications for new jobs"""
-    
-    def __init__(self, config: Dict):
-        self.from_email = config.get('from')
-        self.to_email = config.get('to')
-        self.smtp_server = config.get('smtp_server')
-        self.smtp_port = config.get('smtp_port')
-        self.password = config.get('password')
-    
-    def send_instant_alert(self, job: Dict):
-        """Send instant alert for high-scoring job"""
-        
-        subject = f"🚨 NEW JOB MATCH (Score: {int(job.get('score', 0))}) - {job.get('company')}"
-        
-        body = f"""
+# Instant-alert email body, filled in with str.format per job
+_ALERT_TMPL = """
 <html>
 <body style="font-family: Arial, sans-serif; line-height: 1.6;">
     <h2 style="color: #2ecc71;">New Job Match!</h2>
     
     <div style="background-color: #f8f9fa; padding: 20px; border-radius: 5px; margin: 20px 0;">
-        <h3 style="margin-top: 0; color: #333;">{job.get('title')}</h3>
-        <p><strong>Company:</strong> {job.get('company')}</p>
-        <p><strong>Location:</strong> {job.get('location')}</p>
-        <p><strong>Score:</strong> {int(job.get('score', 0))}/100</p>
-        <p><strong>Posted:</strong> {job.get('posted_date', 'Recently')}</p>
+        <h3 style="margin-top: 0; color: #333;">{title}</h3>
+        <p><strong>Company:</strong> {company}</p>
+        <p><strong>Location:</strong> {location}</p>
+        <p><strong>Score:</strong> {score}/100</p>
+        <p><strong>Posted:</strong> {posted}</p>
     </div>
     
     <div style="margin: 20px 0;">
         <h4>Why this is a good match:</h4>
         <pre style="background-color: #f8f9fa; padding: 15px; border-radius: 5px; white-space: pre-wrap;">
-{job.get('score_explanation', 'Good skill match with your profile')}
+{explanation}
         </pre>
     </div>
     
     <div style="margin: 30px 0;">
-        <a href="{job.get('url')}" 
+        <a href="{url}" 
            style="background-color: #3498db; color: white; padding: 15px 30px; 
                   text-decoration: none; border-radius: 5px; display: inline-block; 
                   font-weight: bold;">
@@ -53,11 +38,85 @@ class EmailNotifier:
     <hr style="margin: 30px 0; border: none; border-top: 1px solid #ddd;">
     
     <p style="color: #7f8c8d; font-size: 12px;">
-        Found by your automated job scraper • {datetime.now().strftime('%B %d, %Y at %I:%M %p')}
+        Found by your automated job scraper • {found_at}
     </p>
 </body>
 </html>
         """
+
+# One job card in the digest email
+_DIGEST_JOB_TMPL = """
+            <div style="background-color: #f8f9fa; padding: 15px; margin: 10px 0; border-radius: 8px; border-left: 4px solid {color};">
+                <h4 style="margin: 0 0 8px 0;">{i}. {title}</h4>
+                <p style="margin: 4px 0;"><strong>{company}</strong> — {location}</p>
+                <p style="margin: 4px 0;">Score: <strong style="color: {color};">{score}/100</strong> &nbsp;·&nbsp; {source}</p>
+                <a href="{url}" style="color: #3498db; text-decoration: none; font-weight: bold;">Apply →</a>
+            </div>
+            """
+
+class EmailNotifier:
+    """Sends email notifications for new jobs.
+
+    One SMTP connection (STARTTLS + login) is opened lazily and reused for
+    every email until close(). Use as a context manager to close it after a
+    batch of sends.
+    """
+    
+    # Reconnect after this many messages to stay under provider limits
+    MAX_PER_CONNECTION = 100
+    
+    def __init__(self, config: Dict):
+        self.from_email = config.get('from')
+        self.to_email = config.get('to')
+        self.smtp_server = config.get('smtp_server')
+        self.smtp_port = config.get('smtp_port')
+        self.password = config.get('password')
+        self._server = None
+        self._sent_on_conn = 0
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    def _ensure_conn(self) -> smtplib.SMTP:
+        if self._server is None:
+            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+            try:
+                server.starttls()
+                server.login(self.from_email, self.password)
+            except Exception:
+                server.close()
+                raise
+            self._server = server
+            self._sent_on_conn = 0
+        return self._server
+    
+    def close(self):
+        """Close the SMTP connection, if one is open."""
+        server, self._server = self._server, None
+        if server is not None:
+            try:
+                server.quit()
+            except Exception:
+                server.close()
+    
+    def send_instant_alert(self, job: Dict):
+        """Send instant alert for high-scoring job"""
+        
+        subject = f"🚨 NEW JOB MATCH (Score: {int(job.get('score', 0))}) - {job.get('company')}"
+        
+        body = _ALERT_TMPL.format(
+            title=job.get('title'),
+            company=job.get('company'),
+            location=job.get('location'),
+            score=int(job.get('score', 0)),
+            posted=job.get('posted_date', 'Recently'),
+            explanation=job.get('score_explanation', 'Good skill match with your profile'),
+            url=job.get('url'),
+            found_at=datetime.now().strftime('%B %d, %Y at %I:%M %p'),
+        )
         
         self._send_email(subject, body)
     
@@ -70,18 +129,19 @@ class EmailNotifier:
         total = total_new or len(jobs)
         subject = f"⚡ Top {len(jobs)} Job Matches — {total} new jobs found"
         
-        jobs_html = ""
+        parts = []
         for i, job in enumerate(jobs[:5], 1):
             score = int(job.get('score', 0))
             color = '#22c55e' if score >= 60 else '#eab308' if score >= 40 else '#f97316'
-            jobs_html += f"""
-            <div style="background-color: #f8f9fa; padding: 15px; margin: 10px 0; border-radius: 8px; border-left: 4px solid {color};">
-                <h4 style="margin: 0 0 8px 0;">{i}. {job.get('title')}</h4>
-                <p style="margin: 4px 0;"><strong>{job.get('company')}</strong> — {job.get('location', 'N/A')}</p>
-                <p style="margin: 4px 0;">Score: <strong style="color: {color};">{score}/100</strong> &nbsp;·&nbsp; {job.get('source', '')}</p>
-                <a href="{job.get('url')}" style="color: #3498db; text-decoration: none; font-weight: bold;">Apply →</a>
-            </div>
-            """
+            parts.append(_DIGEST_JOB_TMPL.format(
+                i=i, color=color, score=score,
+                title=job.get('title'),
+                company=job.get('company'),
+                location=job.get('location', 'N/A'),
+                source=job.get('source', ''),
+                url=job.get('url'),
+            ))
+        jobs_html = ''.join(parts)
         
         remaining = total - len(jobs)
         footer = f"<p style='text-align:center; color:#7f8c8d;'>+ {remaining} more jobs in your dashboard</p>" if remaining > 0 else ""
@@ -112,21 +172,23 @@ class EmailNotifier:
             return
         
         try:
-            # Create message
-            msg = MIMEMultipart('alternative')
+            # Single HTML part — no multipart wrapper needed
+            msg = EmailMessage()
             msg['Subject'] = subject
             msg['From'] = self.from_email
             msg['To'] = self.to_email
+            msg.set_content(body_html, subtype='html', cte='base64')
             
-            # Add HTML body
-            html_part = MIMEText(body_html, 'html')
-            msg.attach(html_part)
-            
-            # Send via Gmail SMTP
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.from_email, self.password)
-                server.send_message(msg)
+            # Send via Gmail SMTP, reusing the open connection
+            try:
+                self._ensure_conn().send_message(msg)
+            except smtplib.SMTPServerDisconnected:
+                # Server dropped an idle connection — reconnect once
+                self._server = None
+                self._ensure_conn().send_message(msg)
+            self._sent_on_conn += 1
+            if self._sent_on_conn >= self.MAX_PER_CONNECTION:
+                self.close()
             
             print(f"✅ Email sent: {subject}")
             
@@ -16,7 +16,7 @@ Usage in main.py:
 
 import json
 import os
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 
 
@@ -36,6 +36,11 @@ class SmartScheduler:
         """
         self.all_keys = [k for k in all_keys if k.get('key')]
         self.state = self._load_state()
+        # Rotation position, kept in step with state['last_key_index']
+        self._n = max(1, len(self.all_keys))
+        self._idx = self.state.get('last_key_index', 0) % self._n
+        self._saved = self._dump(self.state)  # what's on disk, to skip no-op saves
+        self._log_swept_on = None  # date daily_log was last pruned
 
     def _load_state(self) -> Dict:
         try:
@@ -46,11 +51,22 @@ class SmartScheduler:
             pass
         return {"last_key_index": 0, "runs_today": 0, "last_run_date": "", "daily_log": {}}
 
+    @staticmethod
+    def _dump(state: Dict) -> str:
+        return json.dumps(state, separators=(',', ':'))
+
     def _save_state(self):
+        """Write state atomically (temp file + rename), only if it changed."""
+        data = self._dump(self.state)
+        if data == self._saved:
+            return
         try:
             os.makedirs(os.path.dirname(STATE_FILE), exist_ok=True)
-            with open(STATE_FILE, 'w') as f:
-                json.dump(self.state, f, indent=2)
+            tmp = STATE_FILE + '.tmp'
+            with open(tmp, 'w') as f:
+                f.write(data)
+            os.replace(tmp, STATE_FILE)
+            self._saved = data
         except Exception:
             pass
 
@@ -95,11 +111,7 @@ class SmartScheduler:
             self.state['runs_today'] = 0
             self.state['last_run_date'] = today
 
-        # Get current key index
-        idx = self.state.get('last_key_index', 0) % len(self.all_keys)
-        key = self.all_keys[idx]
-
-        return key
+        return self.all_keys[self._idx]
 
     def mark_run_complete(self):
         """Call after a successful scrape run."""
@@ -116,15 +128,18 @@ class SmartScheduler:
         self.state['daily_log'][hour_key] = True
 
         # Rotate to next key for next run
-        self.state['last_key_index'] = (self.state.get('last_key_index', 0) + 1) % len(self.all_keys)
-
-        # Clean old daily_log entries (keep last 7 days)
-        from datetime import timedelta
-        cutoff = (now - timedelta(days=7)).strftime('%Y-%m-%d')
-        self.state['daily_log'] = {
-            k: v for k, v in self.state['daily_log'].items()
-            if k[:10] >= cutoff
-        }
+        self._idx = (self._idx + 1) % self._n
+        self.state['last_key_index'] = self._idx
+
+        # Clean old daily_log entries (keep last 7 days). Entries only age
+        # out by the day, so one sweep per day is enough.
+        if self._log_swept_on != today:
+            cutoff = (now - timedelta(days=7)).strftime('%Y-%m-%d')
+            self.state['daily_log'] = {
+                k: v for k, v in self.state['daily_log'].items()
+                if k[:10] >= cutoff
+            }
+            self._log_swept_on = today
 
         self._save_state()
 
@@ -133,8 +148,7 @@ class SmartScheduler:
         now = datetime.now()
         today = now.strftime('%Y-%m-%d')
         runs = self.state.get('runs_today', 0)
-        idx = self.state.get('last_key_index', 0) % max(len(self.all_keys), 1)
-        key_name = self.all_keys[idx]['name'] if self.all_keys else 'None'
+        key_name = self.all_keys[self._idx]['name'] if self.all_keys else 'None'
 
         lines = [
             f"Date: {today} ({'WEEKEND' if self.is_weekend() else now.strftime('%A')})",
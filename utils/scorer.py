@@ -10,9 +10,18 @@ Features:
   - Returns structured breakdown for the Book UI
 """
 
+import hashlib
+import json
 import re
 import os
-from typing import Dict, List, Tuple, Optional
+from bisect import bisect_right
+from functools import cached_property, lru_cache
+from typing import Callable, Dict, List, Tuple, Optional
+
+try:
+    import ahocorasick  # optional (pyahocorasick) — faster skill scan
+except ImportError:
+    ahocorasick = None
 
 # ── Master skills/tools taxonomy ─────────────────────────────────
 KNOWN_SKILLS = {
@@ -94,6 +103,22 @@ SPONSORSHIP_POSITIVE = [
     r'(?:open\s+to|offer|provide)\s+(?:visa\s+)?sponsor(?:ship)?',
 ]
 
+# Compiled once. Kept as separate patterns: most start with a literal that
+# sre can scan for quickly, and a single '|'-joined alternation loses that
+# (it measured ~40% slower on stored descriptions).
+_CITIZENSHIP_RES = [re.compile(p) for p in CITIZENSHIP_PATTERNS]
+_SPONSORSHIP_RES = [re.compile(p) for p in SPONSORSHIP_POSITIVE]
+
+# Every CITIZENSHIP_PATTERNS match contains at least one of these words, and
+# every SPONSORSHIP_POSITIVE match contains 'sponsor'. Text with none of
+# them can skip the regexes. (Single words only, since the patterns allow
+# any whitespace between words. Update these when adding a pattern.)
+_DEALBREAKER_TRIGGERS = (
+    'citizen', 'clearance', 'sponsor', 'visa', 'resident', 'green', 'gc',
+    'authorized', 'eligible', 'person', 'national',
+)
+_SPONSORSHIP_TRIGGER = 'sponsor'
+
 # ── Technical title keywords ─────────────────────────────────────
 TECHNICAL_KEYWORDS = [
     'software', 'engineer', 'developer', 'programmer',
@@ -116,89 +141,270 @@ NON_TECHNICAL_KEYWORDS = [
     'nurse', 'physician', 'therapist', 'pharmacist',
 ]
 
+# ── Company tiers: (points, names matched as substrings of the company) ──
+COMPANY_TIERS = (
+    (15, ('google', 'meta', 'amazon', 'apple', 'microsoft', 'netflix')),
+    (13, ('uber', 'linkedin', 'stripe', 'goldman', 'morgan stanley',
+          'jpmorgan', 'bloomberg', 'citadel', 'two sigma')),
+    (11, ('openai', 'anthropic', 'databricks', 'snowflake',
+          'notion', 'figma', 'datadog', 'coinbase', 'roblox')),
+)
+
+# Skill-match points by number of matching skills (12+ → 30)
+SKILL_POINTS = (0, 5, 10, 15, 15, 20, 20, 20, 25, 25, 25, 25, 30)
+
+# H-1B points by new hires approved: <1 → 0, 1+ → 4, 10+ → 8, ... 100+ → 20
+H1B_HIRES_BINS = (1, 10, 20, 50, 100)
+H1B_POINTS = (0, 4, 8, 12, 16, 20)
+
 SENIOR_KEYWORDS = [
     'senior', 'staff', 'principal', 'lead', 'director', 'vp ',
     'manager', 'head of', 'architect', '5+', '7+', '8+', '10+',
 ]
 
+JUNIOR_TITLE_KEYWORDS = ['new grad', 'junior', 'entry', 'early career', 'associate',
+                         'i ', ' i,', ' 1 ', ' 1,']
+
+
+def _keyword_finder(keywords: List[str]) -> Callable[[str], object]:
+    """Truthy-result test for "any keyword is a substring of the text", as one
+    scan instead of an `in` test per keyword: an Aho-Corasick automaton when
+    pyahocorasick is installed (~1.5x faster on titles), else a compiled
+    alternation."""
+    if ahocorasick is None:
+        return re.compile('|'.join(map(re.escape, keywords))).search
+    automaton = ahocorasick.Automaton()
+    for kw in keywords:
+        automaton.add_word(kw, kw)
+    automaton.make_automaton()
+    scan = automaton.iter
+    return lambda text: next(scan(text), None)
+
+
+_has_non_technical = _keyword_finder(NON_TECHNICAL_KEYWORDS)
+_has_junior_title = _keyword_finder(JUNIOR_TITLE_KEYWORDS)
+_has_senior_title = _keyword_finder(SENIOR_KEYWORDS)
+_has_technical = _keyword_finder(TECHNICAL_KEYWORDS)
+
+
+# Seniority points by title keyword. The best keyword in the title wins, so
+# taking the max over every match keeps the old if/elif priority order.
+_LEVEL_POINTS = {
+    'new grad': 25, 'new graduate': 25,
+    'early career': 22, 'entry level': 22, 'entry-level': 22,
+    'junior': 18, 'jr.': 18, 'jr ': 18,
+    'associate': 15, ' i ': 15, ' i,': 15, ' 1 ': 15,
+}
+# No level keyword in the title: these anywhere in title + description → 12
+EARLY_CAREER_PHRASES = ('0-2 years', '0-1 year', '1-2 years', 'recent graduate',
+                        'new grads', 'entry level', 'early career')
+_LEVEL_RE = re.compile('|'.join(map(re.escape, sorted(_LEVEL_POINTS, key=len, reverse=True))))
+
+
+# All skills in one pass. A skill must start after a boundary char (or at the
+# start) and be followed by one (or the end). The capture sits inside a
+# lookahead so every position is tried, which catches 'rails' inside
+# 'ruby on rails'. Longest alternative first, so 'react native' beats 'react'.
+_SKILL_RE = re.compile(
+    r'(?<![^\s,;(./\-])(?=('
+    + '|'.join(map(re.escape, sorted(KNOWN_SKILLS, key=len, reverse=True)))
+    + r')(?:[\s,;)./\-]|$))'
+)
+
+# Alternate spellings → the canonical skill name that gets reported
+SKILL_ALIASES = {
+    'react.js': 'react', 'reactjs': 'react',
+    'vue.js': 'vue', 'vuejs': 'vue',
+    'node.js': 'node', 'nodejs': 'node',
+    'express.js': 'express',
+    'next.js': 'nextjs',
+    'golang': 'go',
+    'postgresql': 'postgres', 'postgres': 'postgres',
+    'amazon web services': 'aws',
+    'google cloud': 'gcp',
+    'tailwindcss': 'tailwind',
+    'scikit-learn': 'sklearn',
+    'springboot': 'spring boot',
+    'huggingface': 'hugging face',
+    'k8s': 'kubernetes',
+    'ci cd': 'ci/cd',
+}
+
+# Every known spelling → canonical name, resolved once
+_CANON = {s: SKILL_ALIASES.get(s, s) for s in KNOWN_SKILLS}
+
+# Canonical skills reported for a _SKILL_RE match: the skill itself plus any
+# shorter skill that also matches wherever it does
+# ('react native' → 'react', 'node.js' → 'node')
+_SKILL_IMPLIES = {
+    skill: frozenset(_CANON[s] for s in KNOWN_SKILLS
+                     if s == skill or (len(s) < len(skill) and skill.startswith(s)
+                                       and skill[len(s)] in ' ,;)./-'))
+    for skill in KNOWN_SKILLS
+}
+
 
 def extract_skills_from_text(text: str) -> List[str]:
     """Extract known skills/tools from any text (resume or job description)."""
-    text_lower = text.lower()
-    found = []
-    for skill in KNOWN_SKILLS:
-        # Word boundary check to avoid partial matches
-        pattern = r'(?:^|[\s,;(./\-])' + re.escape(skill) + r'(?:[\s,;)./\-]|$)'
-        if re.search(pattern, text_lower):
-            found.append(skill)
-    # Deduplicate aliases
-    return _dedupe_skills(found)
-
-
-def _dedupe_skills(skills: List[str]) -> List[str]:
-    """Deduplicate skill aliases."""
-    alias_map = {
-        'react.js': 'react', 'reactjs': 'react',
-        'vue.js': 'vue', 'vuejs': 'vue',
-        'node.js': 'node', 'nodejs': 'node',
-        'express.js': 'express',
-        'next.js': 'nextjs',
-        'golang': 'go',
-        'postgresql': 'postgres', 'postgres': 'postgres',
-        'amazon web services': 'aws',
-        'google cloud': 'gcp',
-        'tailwindcss': 'tailwind',
-        'scikit-learn': 'sklearn',
-        'springboot': 'spring boot',
-        'huggingface': 'hugging face',
-        'k8s': 'kubernetes',
-        'ci cd': 'ci/cd',
-    }
-    seen = set()
-    result = []
-    for s in skills:
-        canonical = alias_map.get(s, s)
-        if canonical not in seen:
-            seen.add(canonical)
-            result.append(canonical)
-    return sorted(result)
+    return _skills_in(text.lower())
+
+
+# With pyahocorasick installed: one automaton pass reports every occurrence of
+# every skill (overlaps included), then the same boundary rule as _SKILL_RE is
+# applied to each hit. Same results as the regex, ~3x faster.
+if ahocorasick is not None:
+    _SKILL_AC = ahocorasick.Automaton()
+    for _skill in KNOWN_SKILLS:
+        _SKILL_AC.add_word(_skill, (len(_skill), _CANON[_skill]))
+    _SKILL_AC.make_automaton()
+else:
+    _SKILL_AC = None
+
+# Boundary chars besides whitespace, before and after a skill
+_SKILL_LEAD = frozenset(',;(./-')
+_SKILL_TRAIL = frozenset(',;)./-')
+
+
+def _skills_in(text_lower: str) -> List[str]:
+    """extract_skills_from_text for text that is already lowercased."""
+    found = set()
+    if _SKILL_AC is not None:
+        n = len(text_lower)
+        for end, (length, skill) in _SKILL_AC.iter(text_lower):
+            start = end - length + 1
+            if start:
+                c = text_lower[start - 1]
+                if c not in _SKILL_LEAD and not c.isspace():
+                    continue
+            if end + 1 < n:
+                c = text_lower[end + 1]
+                if c not in _SKILL_TRAIL and not c.isspace():
+                    continue
+            found.add(skill)
+    else:
+        for m in _SKILL_RE.finditer(text_lower):
+            found.update(_SKILL_IMPLIES[m.group(1)])
+    # Aliases are already canonical, so the set is deduplicated
+    return sorted(found)
 
 
 def check_dealbreakers(text: str) -> Dict:
     """Check for citizenship/clearance/no-sponsorship dealbreakers."""
-    text_lower = text.lower()
+    return _dealbreakers_in(text.lower())
+
+
+def _dealbreakers_in(text_lower: str) -> Dict:
+    """check_dealbreakers for text that is already lowercased."""
     result = {
         'has_dealbreaker': False,
         'reasons': [],
         'sponsorship_positive': False,
     }
 
-    for pattern in CITIZENSHIP_PATTERNS:
-        if re.search(pattern, text_lower):
-            result['has_dealbreaker'] = True
-            match = re.search(pattern, text_lower)
-            result['reasons'].append(match.group(0).strip())
-            break  # One is enough
+    if any(t in text_lower for t in _DEALBREAKER_TRIGGERS):
+        for pattern in _CITIZENSHIP_RES:
+            match = pattern.search(text_lower)
+            if match:
+                result['has_dealbreaker'] = True
+                result['reasons'].append(match.group(0).strip())
+                break  # One is enough
 
-    for pattern in SPONSORSHIP_POSITIVE:
-        if re.search(pattern, text_lower):
-            result['sponsorship_positive'] = True
-            break
+    if _SPONSORSHIP_TRIGGER in text_lower:
+        for pattern in _SPONSORSHIP_RES:
+            if pattern.search(text_lower):
+                result['sponsorship_positive'] = True
+                break
 
     return result
 
 
+@lru_cache(maxsize=4096)
+def _company_points(company: str) -> int:
+    """Company tier bonus. Memoized on the raw name — a run sees the same few
+    hundred companies over and over, so most calls skip even the lower()."""
+    co = company.lower()
+    for points, names in COMPANY_TIERS:
+        if any(x in co for x in names):
+            return points
+    return 5
+
+
 def is_technical_role(job_title: str) -> bool:
     """Check if job is a technical engineering role."""
-    t = job_title.lower()
-    if any(kw in t for kw in NON_TECHNICAL_KEYWORDS):
+    return _is_technical_title(job_title.lower())
+
+
+@lru_cache(maxsize=4096)
+def _is_technical_title(t: str) -> bool:
+    """is_technical_role for a title that is already lowercased. Memoized —
+    the same titles ('software engineer', ...) come up across every board."""
+    if _has_non_technical(t):
         return False
-    has_junior = any(kw in t for kw in ['new grad', 'junior', 'entry', 'early career', 'associate', 'i ', ' i,', ' 1 ', ' 1,'])
-    if not has_junior and any(kw in t for kw in SENIOR_KEYWORDS):
+    if not _has_junior_title(t) and _has_senior_title(t):
         return False
-    if any(kw in t for kw in TECHNICAL_KEYWORDS):
-        return True
-    return False
+    return _has_technical(t) is not None
+
+
+# Text extracted from the resume PDF, keyed by the file's path/mtime/size, so
+# scheduled runs skip PDF parsing until the resume changes
+RESUME_CACHE_FILE = "./database/resume_cache.json"
+
+
+def _load_resume_cache(key: list) -> Optional[str]:
+    try:
+        with open(RESUME_CACHE_FILE) as f:
+            data = json.load(f)
+        if data.get('key') == key:
+            return data.get('text')
+    except Exception:
+        pass
+    return None
+
+
+def _save_resume_cache(key: list, text: str):
+    try:
+        os.makedirs(os.path.dirname(RESUME_CACHE_FILE), exist_ok=True)
+        tmp = RESUME_CACHE_FILE + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump({'key': key, 'text': text}, f)
+        os.replace(tmp, RESUME_CACHE_FILE)
+    except Exception:
+        pass
+
+
+def scoring_fingerprint() -> str:
+    """Hash of everything besides the resume and the job that decides a
+    score: this module's source (the scoring logic) and the tables it reads,
+    in a canonical order. It is part of every score-cache key, so editing
+    any of them retires the scores cached under the old rules."""
+    h = hashlib.sha1()
+    try:
+        with open(__file__, 'rb') as f:
+            h.update(f.read())
+    except OSError:
+        pass
+    tables = (
+        sorted(KNOWN_SKILLS), sorted(SKILL_ALIASES.items()), SKILL_POINTS,
+        H1B_HIRES_BINS, H1B_POINTS, COMPANY_TIERS,
+        sorted(_LEVEL_POINTS.items()), EARLY_CAREER_PHRASES,
+        TECHNICAL_KEYWORDS, NON_TECHNICAL_KEYWORDS, SENIOR_KEYWORDS, JUNIOR_TITLE_KEYWORDS,
+        CITIZENSHIP_PATTERNS, SPONSORSHIP_POSITIVE, _DEALBREAKER_TRIGGERS, _SPONSORSHIP_TRIGGER,
+    )
+    h.update(repr(tables).encode())
+    return h.hexdigest()
+
+
+class JobScoreResult:
+    """A job's score; the explanation is only built if someone reads it."""
+
+    def __init__(self, scorer: 'JobScorer', job: Dict, score: float):
+        self.score = score
+        self._scorer = scorer
+        self._job = job
+
+    @cached_property
+    def explanation(self) -> str:
+        return self._scorer.explain_score(self._job, self.score)
 
 
 class JobScorer:
@@ -209,6 +415,20 @@ class JobScorer:
         self.resume_skills: List[str] = []
         self.resume_text: str = ''
         self._parse_resume()
+        # Fixed once parsed — every job is matched against this one set
+        self._resume_skill_set = frozenset(self.resume_skills)
+        # Fallback substring scan in one automaton pass (when available)
+        self._resume_ac = None
+        if ahocorasick is not None and self._resume_skill_set:
+            self._resume_ac = ahocorasick.Automaton()
+            for skill in self._resume_skill_set:
+                self._resume_ac.add_word(skill, skill)
+            self._resume_ac.make_automaton()
+        # Scores depend on the resume only through its skills, so that (plus
+        # the scoring rules themselves) is what the score cache is keyed on
+        self.resume_hash = hashlib.sha1('\n'.join(
+            [scoring_fingerprint(), *sorted(self._resume_skill_set)]
+        ).encode()).hexdigest()
 
     def _parse_resume(self):
         """Parse resume PDF to extract skills and text."""
@@ -226,25 +446,16 @@ class JobScorer:
             return
 
         try:
-            # Try PyPDF2 first
-            try:
-                import PyPDF2
-                with open(self.resume_path, 'rb') as f:
-                    reader = PyPDF2.PdfReader(f)
-                    self.resume_text = ' '.join(
-                        page.extract_text() or '' for page in reader.pages
-                    )
-            except ImportError:
-                # Fallback: try pdfplumber
-                try:
-                    import pdfplumber
-                    with pdfplumber.open(self.resume_path) as pdf:
-                        self.resume_text = ' '.join(
-                            page.extract_text() or '' for page in pdf.pages
-                        )
-                except ImportError:
+            stat = os.stat(self.resume_path)
+            key = [os.path.abspath(self.resume_path), stat.st_mtime_ns, stat.st_size]
+            text = _load_resume_cache(key)
+            if text is None:
+                text = self._read_pdf_text()
+                if text is None:
                     print("  ⚠ No PDF library found. Install PyPDF2: pip install PyPDF2")
                     return
+                _save_resume_cache(key, text)
+            self.resume_text = text
 
             self.resume_skills = extract_skills_from_text(self.resume_text)
             print(f"  ✓ Parsed resume: {len(self.resume_skills)} skills detected")
@@ -253,6 +464,64 @@ class JobScorer:
         except Exception as e:
             print(f"  ⚠ Resume parse error: {e}")
 
+    def _read_pdf_text(self) -> Optional[str]:
+        """All page text from the resume PDF, or None if no PDF library."""
+        # Try PyPDF2 first
+        try:
+            import PyPDF2
+            with open(self.resume_path, 'rb') as f:
+                reader = PyPDF2.PdfReader(f)
+                return ' '.join(page.extract_text() or '' for page in reader.pages)
+        except ImportError:
+            pass
+        # Fallback: try pdfplumber
+        try:
+            import pdfplumber
+            with pdfplumber.open(self.resume_path) as pdf:
+                return ' '.join(page.extract_text() or '' for page in pdf.pages)
+        except ImportError:
+            return None
+
+    # ── Shared per-job analysis ──────────────────────────────────
+    # score_job, explain_score and get_job_analysis all read the same text
+    # work. It is cached on the job dict under '_analysis' so a job that goes
+    # through all three is lowercased and skill-scanned once.
+
+    @staticmethod
+    def _lower(job: Dict, field: str) -> str:
+        """job[field].lower(), computed at most once per job."""
+        analysis = job.setdefault('_analysis', {})
+        key = field + '_lower'
+        value = analysis.get(key)
+        if value is None:
+            value = analysis[key] = (job.get(field) or '').lower()
+        return value
+
+    def _dealbreakers(self, job: Dict) -> Dict:
+        analysis = job.setdefault('_analysis', {})
+        deal = analysis.get('dealbreaker')
+        if deal is None:
+            deal = analysis['dealbreaker'] = _dealbreakers_in(self._lower(job, 'description'))
+        return deal
+
+    def analyze(self, job: Dict) -> Dict:
+        """Lowercased text, job skills vs resume, and dealbreakers for one job
+        (cached in job['_analysis']). The score itself is not cached since it
+        depends on the H-1B data passed to score_job."""
+        analysis = job.setdefault('_analysis', {})
+        if 'job_skills' not in analysis:
+            text = self._lower(job, 'title') + ' ' + self._lower(job, 'description')
+            job_skills = _skills_in(text)
+            analysis.update(
+                text=text,
+                job_skills=job_skills,
+                matching_skills=sorted(self._resume_skill_set.intersection(job_skills)),
+                missing_skills=sorted(set(job_skills).difference(self._resume_skill_set)),
+                extra_skills=sorted(self._resume_skill_set.difference(job_skills)),
+            )
+            self._dealbreakers(job)
+        return analysis
+
     def score_job(self, job: Dict, h1b_data: Dict = None) -> float:
         """
         Score 0-100:
@@ -265,56 +534,37 @@ class JobScorer:
 
         Dealbreaker = forced to 0 (citizenship, clearance, no sponsor)
         """
-        title = job.get('title', '')
-        desc = job.get('description', '')
-        text = (title + ' ' + desc).lower()
+        t = self._lower(job, 'title')
 
         # ── Hard filters ──
-        if not is_technical_role(title):
+        if not _is_technical_title(t):
             return 0
 
         # ── Dealbreaker check ──
-        deal = check_dealbreakers(desc)
+        deal = self._dealbreakers(job)
         if deal['has_dealbreaker'] and not deal['sponsorship_positive']:
             return 0
 
         score = 10  # base
 
         # ── 1. SKILL MATCH (max 30) ──
-        job_skills = extract_skills_from_text(text)
-        if self.resume_skills and job_skills:
-            matching = set(self.resume_skills) & set(job_skills)
-            n = len(matching)
-            if n >= 12: score += 30
-            elif n >= 8: score += 25
-            elif n >= 5: score += 20
-            elif n >= 3: score += 15
-            elif n >= 1: score += n * 5
+        analysis = self.analyze(job)
+        text = analysis['text']
+        if self.resume_skills and analysis['job_skills']:
+            n = len(analysis['matching_skills'])
         else:
-            # Fallback: basic keyword match
-            matches = [s for s in self.resume_skills if s in text]
-            n = len(matches)
-            if n >= 12: score += 30
-            elif n >= 8: score += 25
-            elif n >= 5: score += 20
-            elif n >= 3: score += 15
-            elif n >= 1: score += n * 5
+            # Fallback: basic keyword match (resume skills as plain substrings)
+            if self._resume_ac is not None:
+                n = len({skill for _, skill in self._resume_ac.iter(text)})
+            else:
+                n = sum(1 for s in self._resume_skill_set if s in text)
+        score += SKILL_POINTS[min(n, 12)]
 
         # ── 2. ROLE / SENIORITY (max 25) ──
-        t = title.lower()
-        if any(kw in t for kw in ['new grad', 'new graduate']):
-            score += 25
-        elif 'early career' in t:
-            score += 22
-        elif any(kw in t for kw in ['entry level', 'entry-level']):
-            score += 22
-        elif any(kw in t for kw in ['junior', 'jr.', 'jr ']):
-            score += 18
-        elif any(kw in t for kw in ['associate', ' i ', ' i,', ' 1 ']):
-            score += 15
-        elif any(kw in text for kw in ['0-2 years', '0-1 year', '1-2 years',
-                                        'recent graduate', 'new grads',
-                                        'entry level', 'early career']):
+        levels = _LEVEL_RE.findall(t)
+        if levels:
+            score += max(map(_LEVEL_POINTS.__getitem__, levels))
+        elif any(kw in text for kw in EARLY_CAREER_PHRASES):
             score += 12
         else:
             score += 5
@@ -322,43 +572,48 @@ class JobScorer:
         # ── 3. H-1B / SPONSORSHIP (max 20) ──
         if h1b_data:
             hires = h1b_data.get('New_Hires_Approved_2025', 0)
-            if hires >= 100: score += 20
-            elif hires >= 50: score += 16
-            elif hires >= 20: score += 12
-            elif hires >= 10: score += 8
-            elif hires >= 1: score += 4
+            score += H1B_POINTS[bisect_right(H1B_HIRES_BINS, hires)]
 
         if deal.get('sponsorship_positive'):
             score += 5
 
         # ── 4. COMPANY TIER (max 15) ──
-        co = job.get('company', '').lower()
-        tier1 = ['google', 'meta', 'amazon', 'apple', 'microsoft', 'netflix']
-        tier2 = ['uber', 'linkedin', 'stripe', 'goldman', 'morgan stanley',
-                 'jpmorgan', 'bloomberg', 'citadel', 'two sigma']
-        tier3 = ['openai', 'anthropic', 'databricks', 'snowflake',
-                 'notion', 'figma', 'datadog', 'coinbase', 'roblox']
-
-        if any(x in co for x in tier1): score += 15
-        elif any(x in co for x in tier2): score += 13
-        elif any(x in co for x in tier3): score += 11
-        else: score += 5
+        score += _company_points(job.get('company') or '')
 
         return min(score, 100)
 
+    def score(self, job: Dict, h1b_data: Dict = None) -> JobScoreResult:
+        """score_job, with explain_score deferred until .explanation is read."""
+        return JobScoreResult(self, job, self.score_job(job, h1b_data))
+
+    def score_jobs(self, jobs: List[Dict], h1b_data: List[Optional[Dict]] = None) -> List[float]:
+        """score_job over a batch. h1b_data, if given, lines up with jobs."""
+        score_job = self.score_job
+        if h1b_data is None:
+            return [score_job(job) for job in jobs]
+        return [score_job(job, h1b) for job, h1b in zip(jobs, h1b_data)]
+
+    def cache_key(self, job: Dict, h1b_data: Dict = None) -> str:
+        """Score-cache key: everything score_job and explain_score read —
+        the resume, the job's title/company/description and its H-1B hires."""
+        hires = h1b_data.get('New_Hires_Approved_2025', 0) if h1b_data else 0
+        content = '\0'.join((
+            self.resume_hash, job.get('title') or '', job.get('company') or '',
+            job.get('description') or '', repr(hires),
+        ))
+        return hashlib.sha1(content.encode('utf-8', 'surrogatepass')).hexdigest()
+
     def explain_score(self, job: Dict, score: float) -> str:
         """Structured score explanation for the UI."""
         if score == 0:
-            desc = job.get('description', '')
-            deal = check_dealbreakers(desc)
+            deal = self._dealbreakers(job)
             if deal['has_dealbreaker']:
                 return f"🚫 Dealbreaker: {deal['reasons'][0] if deal['reasons'] else 'citizenship/clearance required'}"
             return "Not a matching technical role"
 
-        text = (job.get('title', '') + ' ' + job.get('description', '')).lower()
-        job_skills = extract_skills_from_text(text)
-        matching = sorted(set(self.resume_skills) & set(job_skills))
-        missing = sorted(set(job_skills) - set(self.resume_skills))
+        analysis = self.analyze(job)
+        matching = analysis['matching_skills']
+        missing = analysis['missing_skills']
 
         parts = []
         if matching:
@@ -366,12 +621,12 @@ class JobScorer:
         if missing:
             parts.append(f"📝 Skills to learn ({len(missing)}): {', '.join(missing[:6])}")
 
-        title = job.get('title', '').lower()
+        title = self._lower(job, 'title')
         if 'new grad' in title: parts.append("🎓 New Grad role")
         elif 'early career' in title: parts.append("🎓 Early Career")
         elif any(kw in title for kw in ['junior', 'entry']): parts.append("🎓 Junior / Entry-Level")
 
-        deal = check_dealbreakers(job.get('description', ''))
+        deal = analysis['dealbreaker']
         if deal.get('sponsorship_positive'):
             parts.append("✅ Visa sponsorship available")
 
@@ -381,12 +636,12 @@ class JobScorer:
 
     def get_job_analysis(self, job: Dict) -> Dict:
         """Full structured analysis for the Book UI."""
-        text = (job.get('title', '') + ' ' + job.get('description', '')).lower()
-        job_skills = extract_skills_from_text(text)
-        matching = sorted(set(self.resume_skills) & set(job_skills))
-        missing = sorted(set(job_skills) - set(self.resume_skills))
-        extra = sorted(set(self.resume_skills) - set(job_skills))
-        deal = check_dealbreakers(job.get('description', ''))
+        analysis = self.analyze(job)
+        job_skills = analysis['job_skills']
+        matching = analysis['matching_skills']
+        missing = analysis['missing_skills']
+        extra = analysis['extra_skills']
+        deal = analysis['dealbreaker']
 
         match_pct = 0
         if job_skills: